@@ -1,53 +1,46 @@
-print("Enter the number of queens")
-N = int(input())
-
-# সমস্ত সমাধান সংরক্ষণ করার জন্য লিস্ট
-all_solutions = []
-
-def is_attack(i, j, board):
-    # কলাম চেক
-    for k in range(i):
-        if board[k][j] == 1:
-            return True
-    
-    # উপরের ডান দিকের ডায়াগোনাল চেক
-    k, l = i-1, j+1
-    while k >= 0 and l < N:
-        if board[k][l] == 1:
-            return True
-        k -= 1
-        l += 1
-    
-    # উপরের বাম দিকের ডায়াগোনাল চেক
-    k, l = i-1, j-1
-    while k >= 0 and l >= 0:
-        if board[k][l] == 1:
-            return True
-        k -= 1
-        l -= 1
-    
-    return False
-
-def n_queen(row, n, board):
-    if n == 0:
-        # বোর্ডের একটি কপি সংরক্ষণ করুন
-        all_solutions.append([row[:] for row in board])
-        return
-    
-    for j in range(N):
-        if not is_attack(row, j, board):
-            board[row][j] = 1
-            
-            n_queen(row+1, n-1, board)
-            
-            board[row][j] = 0  # ব্যাকট্র্যাকিং
-
-initial_board = [[0]*N for _ in range(N)]
-n_queen(0, N, initial_board)
-
-print(f"\nTotal solutions found: {len(all_solutions)}\n")
-for idx, solution in enumerate(all_solutions, 1):
-    print(f"Solution {idx}:")
-    for row in solution:
-        print(row)
-    print()
\ No newline at end of file
+import argparse
+import sys
+
+from nqueens import FORMATS, find_one, write_solutions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enumerate N-Queens solutions")
+    parser.add_argument("n", type=int, nargs="?", help="number of queens (prompted for if omitted)")
+    parser.add_argument("--limit", type=int, default=None, help="stop after this many solutions")
+    parser.add_argument("--format", choices=FORMATS, default="board",
+                        help="board: 0/1 rows, text: column indices, binary: packed records, count: total only")
+    parser.add_argument("--one", action="store_true",
+                        help="find a single placement (min-conflicts for large N) instead of enumerating")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for --one")
+    parser.add_argument("-o", "--output", help="write here instead of stdout")
+    args = parser.parse_args()
+
+    N = args.n
+    if N is None:
+        N = int(input("Enter the number of queens\n"))
+
+    solutions = None
+    if args.one:
+        solution = find_one(N, args.seed)
+        solutions = [solution] if solution is not None else []
+
+    # সমাধানগুলো খুঁজে পাওয়ার সাথে সাথেই লেখা হয়, সব একসাথে জমা রাখা হয় না
+    if args.output:
+        with open(args.output, "wb", buffering=1 << 20) as out:
+            total = write_solutions(N, out, args.format, args.limit, solutions)
+    else:
+        out = sys.stdout.buffer
+        try:
+            total = write_solutions(N, out, args.format, args.limit, solutions)
+            out.flush()
+        except BrokenPipeError:
+            # e.g. piped into `head`; stop quietly like other CLI tools
+            sys.stderr.close()
+            return
+
+    if args.format == "board":
+        print(f"Total solutions found: {total}")
+
+if __name__ == "__main__":
+    main()
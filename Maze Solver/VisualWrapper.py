@@ -1,14 +1,131 @@
 class VisualWrapper:
-    def __init__(self, canvas, core_solver):
+    """Animates a search on a grid canvas at a fixed frame rate.
+
+    The search engine's steps(start, end) supplies ("expand", cell) and
+    ("path", cell) events (a solver with only solve() animates just the
+    path). When that is a searchworker.EventStream, as for the searchcore
+    engines, the search runs on its thread and each frame only takes the
+    events already there, so the Tk thread never waits on the search. Each frame takes up to `speed` events
+    and applies them as one batch of recolors, and the next frame is the
+    only pending Tk timer, however long the search.
+
+    Cells are recolored through the solver's GridView (`core_solver.view`)
+    when it has one, otherwise through the item-id grid `canvas.grid[x][y]`.
+    """
+    fps = 30
+    colors = {"expand": "#add8e6", "path": "yellow"}
+
+    def __init__(self, canvas, core_solver, speed=20):
         self.canvas = canvas
         self.core_solver = core_solver
+        self.speed = speed  # events per frame
+        self.events = None
+        self.timer = None
+        self.on_finish = None
+        self.original = {}  # cell -> color before the animation touched it
+        self.painted = {}   # cell -> color the animation gave it
+
+    def run_with_animation(self, algo, start, end, on_finish=None):
+        """algo is a search engine with steps(start, end), such as a
+        searchcore.SearchAlgorithm, or a name the solver's algorithm(name)
+        turns into one"""
+        self.stop()
+        self.restore()
+        if isinstance(algo, str) and hasattr(self.core_solver, "algorithm"):
+            algo = self.core_solver.algorithm(algo)
+        if hasattr(algo, "steps"):
+            self.events = algo.steps(start, end)
+        else:
+            self.events = (("path", node) for node in self.core_solver.solve(algo, start, end))
+        self.on_finish = on_finish
+        self.timer = self.canvas.after(0, self.tick)
+
+    def set_speed(self, events_per_frame):
+        self.speed = max(1, int(events_per_frame))
+
+    def tick(self):
+        self.timer = None
+        if hasattr(self.events, "poll"):
+            batch = self.events.poll(self.speed)
+            self.paint(batch)
+            if self.events.done:
+                self.finish()
+            else:
+                self.timer = self.canvas.after(1000 // self.fps, self.tick)
+            return
+        batch = []
+        for _ in range(self.speed):
+            event = next(self.events, None)
+            if event is None:
+                self.paint(batch)
+                self.finish()
+                return
+            batch.append(event)
+        self.paint(batch)
+        self.timer = self.canvas.after(1000 // self.fps, self.tick)
+
+    def skip_to_end(self):
+        """Apply every remaining event in one update"""
+        if self.events is None:
+            return
+        if self.timer is not None:
+            self.canvas.after_cancel(self.timer)
+            self.timer = None
+        self.paint(list(self.events))
+        self.finish()
+
+    def stop(self):
+        """Stop the animation (and the search feeding it) where it is"""
+        if self.timer is not None:
+            self.canvas.after_cancel(self.timer)
+            self.timer = None
+        self.close_events()
+
+    def finish(self):
+        self.close_events()
+        print("Path complete.")
+        if self.on_finish is not None:
+            self.on_finish()
+
+    def close_events(self):
+        if hasattr(self.events, "close"):
+            self.events.close()
+        self.events = None
+
+    def restore(self):
+        """Put back the colors of the cells the last animation changed
+        (unless something else has recolored them since)"""
+        self.recolor([(cell, color) for cell, color in self.original.items()
+                      if self.color_of(cell) == self.painted[cell]])
+        self.original.clear()
+        self.painted.clear()
+
+    def paint(self, events):
+        # Last event per cell wins, so a path cell drawn over an expanded
+        # one is recolored once
+        changes = {}
+        for kind, cell in events:
+            changes[cell] = self.colors[kind]
+        for cell in changes:
+            if cell not in self.original:
+                self.original[cell] = self.color_of(cell)
+        self.painted.update(changes)
+        self.recolor(list(changes.items()))
+
+    def color_of(self, cell):
+        view = getattr(self.core_solver, "view", None)
+        if view is not None:
+            return view.colors[cell[0] * view.cols + cell[1]]
+        x, y = cell
+        return self.canvas.itemcget(self.canvas.grid[x][y], "fill")
 
-    def run_with_animation(self, algo, start, end):
-        path = self.core_solver.solve(algo, start, end)
-        for index, node in enumerate(path):
-            self.canvas.after(index * 50, lambda n=node: self.animate_node(n))
-        self.canvas.after(len(path) * 50, lambda: print("Path complete."))
+    def recolor(self, changes):
+        view = getattr(self.core_solver, "view", None)
+        if view is not None:
+            view.set_cells(changes)
+            return
+        for (x, y), color in changes:
+            self.canvas.itemconfig(self.canvas.grid[x][y], fill=color)
 
     def animate_node(self, node):
-        x, y = node
-        self.canvas.itemconfig(self.canvas.grid[x][y], fill="yellow")
+        self.paint([("path", node)])
@@ -1,9 +1,23 @@
 import tkinter as tk
-from tkinter import simpledialog, messagebox
+from tkinter import simpledialog, messagebox, filedialog
 from tkinter import ttk
 import random
+import os
+import sys
+import time
 from collections import deque
 
+# The grid engines and other shared modules live in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gridview import OPEN, WALL, GridView
+import searchcore
+from reachability import DIRECTIONS, GridReachability
+from searchworker import SearchRunner
+try:
+    import gridsearch
+except ImportError:  # NumPy not installed: keep the cell-by-cell searches
+    gridsearch = None
+
 # Login window
 class LoginWindow:
     def __init__(self, root, on_success):
@@ -38,6 +52,24 @@ class LoginWindow:
 
 # Pathfinding visua
 class PathfindingVisualizer:
+    # Grids at least this big run BFS as a NumPy wavefront (gridsearch.py)
+    wavefront_min_cells = 10000
+    # Component labels of the open cells, so walled-off goals fail at once
+    reach = None
+    # Canvas items for the cells, markers and paths (see gridview.py)
+    view = None
+    # Searches run on worker threads (see searchworker.py); a worker's copy
+    # of the visualizer gets the job's cancel flag here
+    runner = None
+    cancelled = None
+    # Called with each cell bfs()/dfs() expands, e.g. to record the search order
+    on_expand = None
+    # Called as on_search(algo, path, seconds) when a search finishes
+    on_search = None
+    # Open Maze takes saved mazes (see mazefile.py) of up to this many rows
+    # and columns: one pixel per cell on the 500x500 canvas
+    max_open_side = 500
+
     def __init__(self, root):
         self.root = root
         self.root.title("AI Pathfinding Visualizer (BFS/DFS)")
@@ -46,10 +78,16 @@ class PathfindingVisualizer:
         self.maze = []
         self.start = (0, 0)
         self.goal = (9, 9)
+        self.runner = SearchRunner(root)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.setup_controls()
         self.setup_canvas()
         self.generate_maze()
 
+    def close(self):
+        self.runner.shutdown()
+        self.root.destroy()
+
     def setup_controls(self):
         control_frame = tk.Frame(self.root)
         control_frame.pack(pady=10)
@@ -66,6 +104,12 @@ class PathfindingVisualizer:
         self.btn_compare = ttk.Button(control_frame, text="Run Both (BFS vs DFS)", command=self.run_both)
         self.btn_compare.pack(side=tk.LEFT, padx=5)
 
+        self.btn_open = ttk.Button(control_frame, text="Open Maze", command=self.open_maze)
+        self.btn_open.pack(side=tk.LEFT, padx=5)
+
+        self.btn_save = ttk.Button(control_frame, text="Save Maze", command=self.save_maze)
+        self.btn_save.pack(side=tk.LEFT, padx=5)
+
         self.lbl_status = ttk.Label(control_frame, text="Ready")
         self.lbl_status.pack(side=tk.LEFT, padx=10)
 
@@ -74,6 +118,7 @@ class PathfindingVisualizer:
         self.canvas.pack()
         self.canvas.bind("<Button-1>", self.set_start)
         self.canvas.bind("<Button-3>", self.set_goal)
+        self.canvas.bind("<Shift-Button-1>", self.toggle_wall)
 
     def generate_maze(self):
         self.maze = []
@@ -82,55 +127,174 @@ class PathfindingVisualizer:
             self.maze.append(row)
         self.maze[self.start[0]][self.start[1]] = 0
         self.maze[self.goal[0]][self.goal[1]] = 0
+        self.reach = GridReachability(self.maze)
         self.draw_maze()
         self.lbl_status.config(text="New maze generated")
 
+    def open_maze(self, path=None):
+        """Load a bit-packed .maze file, with its start and goal"""
+        import mazefile  # needs NumPy, like the wavefront search
+
+        path = path or filedialog.askopenfilename(filetypes=[("Maze files", "*.maze"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            with mazefile.load(path) as saved:
+                rows, cols = saved.rows, saved.cols
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Open Maze", str(error))
+            return
+        if max(rows, cols) > self.max_open_side:
+            messagebox.showerror("Open Maze", f"{rows}x{cols} is too large to display")
+            return
+        name = os.path.basename(path)
+        self.lbl_status.config(text=f"Opening {name}...")
+        self.runner.submit("Open", self.load_maze, path,
+                           on_done=lambda loaded: self.show_maze(name, loaded),
+                           on_error=lambda error: messagebox.showerror("Open Maze", str(error)))
+
+    @staticmethod
+    def load_maze(path, job=None):
+        """(maze, start, goal, reachability) of a maze file; runs on a worker"""
+        import mazefile
+
+        with mazefile.load(path) as saved:
+            maze = saved.to_grid().tolist()
+            start, goal = saved.start, saved.goal
+        return maze, start, goal, GridReachability(maze)
+
+    def show_maze(self, name, loaded):
+        self.maze, self.start, self.goal, self.reach = loaded
+        self.rows, self.cols = len(self.maze), len(self.maze[0])
+        self.draw_maze()
+        self.lbl_status.config(text=f"Opened {name} ({self.rows}x{self.cols})")
+
+    def save_maze(self, path=None):
+        import mazefile
+
+        path = path or filedialog.asksaveasfilename(defaultextension=".maze",
+                                                    filetypes=[("Maze files", "*.maze")])
+        if not path:
+            return
+        mazefile.save(path, self.maze, start=self.start, goal=self.goal)
+        self.lbl_status.config(text=f"Saved {os.path.basename(path)}")
+
+    def toggle_wall(self, event):
+        cell = self.view.cell_at(event.x, event.y)
+        if cell is not None and cell not in (self.start, self.goal):
+            r, c = cell
+            self.maze[r][c] = 1 - self.maze[r][c]
+            self.reach.set_cell((r, c), self.maze[r][c])
+            self.view.set_cells([(cell, WALL if self.maze[r][c] else OPEN)])
+            self.maze_changed()
+            self.lbl_status.config(text=f"Cell ({r}, {c}) is now {'a wall' if self.maze[r][c] else 'open'}")
+
+    def unreachable(self):
+        return self.reach is not None and not self.reach.connected(self.start, self.goal)
+
     def draw_maze(self):
-        self.canvas.delete("all")
-        cell_size = 500 // max(self.rows, self.cols)
-        for r in range(self.rows):
-            for c in range(self.cols):
-                x1, y1 = c * cell_size, r * cell_size
-                x2, y2 = x1 + cell_size, y1 + cell_size
-                color = 'black' if self.maze[r][c] == 1 else 'white'
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color)
-                if (r, c) == self.start:
-                    self.canvas.create_oval(x1+5, y1+5, x2-5, y2-5, fill='green')
-                elif (r, c) == self.goal:
-                    self.canvas.create_oval(x1+5, y1+5, x2-5, y2-5, fill='red')
+        """Repaint the cells that changed; canvas items are only created when
+        the grid size changes"""
+        if self.view is None or (self.view.rows, self.view.cols) != (self.rows, self.cols):
+            self.view = GridView(self.canvas, self.rows, self.cols)
+        self.view.paint(self.maze)
+        self.maze_changed()
+        self.draw_markers()
+
+    def maze_changed(self):
+        """Drop shown paths and running searches, which no longer apply"""
+        self.view.clear_paths()
+        if self.runner is not None:
+            self.runner.cancel()
+
+    def draw_markers(self):
+        self.view.set_marker("start", self.start, "green")
+        self.view.set_marker("goal", self.goal, "red")
 
     def set_start(self, event):
-        cell_size = 500 // max(self.rows, self.cols)
-        c = event.x // cell_size
-        r = event.y // cell_size
-        if 0 <= r < self.rows and 0 <= c < self.cols and self.maze[r][c] == 0:
-            self.start = (r, c)
-            self.draw_maze()
-            self.lbl_status.config(text=f"Start set to ({r}, {c})")
+        cell = self.view.cell_at(event.x, event.y)
+        if cell is not None and self.maze[cell[0]][cell[1]] == 0:
+            self.start = cell
+            self.maze_changed()
+            self.draw_markers()
+            self.lbl_status.config(text=f"Start set to {cell}")
 
     def set_goal(self, event):
-        cell_size = 500 // max(self.rows, self.cols)
-        c = event.x // cell_size
-        r = event.y // cell_size
-        if 0 <= r < self.rows and 0 <= c < self.cols and self.maze[r][c] == 0:
-            self.goal = (r, c)
-            self.draw_maze()
-            self.lbl_status.config(text=f"Goal set to ({r}, {c})")
+        cell = self.view.cell_at(event.x, event.y)
+        if cell is not None and self.maze[cell[0]][cell[1]] == 0:
+            self.goal = cell
+            self.maze_changed()
+            self.draw_markers()
+            self.lbl_status.config(text=f"Goal set to {cell}")
+
+    def search_copy(self):
+        """Copy of the maze, start and goal that a worker can search while
+        the user keeps editing this one"""
+        copy = object.__new__(type(self))
+        copy.rows, copy.cols = self.rows, self.cols
+        copy.maze = [row[:] for row in self.maze]
+        copy.start, copy.goal = self.start, self.goal
+        return copy
+
+    def start_search(self, name, on_done):
+        """Run self.bfs/self.dfs (by name) on a worker and pass the path to
+        on_done; the component check needs no search, so it stays here"""
+        if self.unreachable():
+            self.search_done(name, on_done, (None, 0.0))
+            return
+        copy = self.search_copy()
+        def work(job):
+            copy.cancelled = job.cancelled
+            t = time.perf_counter()
+            path = getattr(copy, name.lower())()
+            return path, time.perf_counter() - t
+        self.runner.submit(name, work, on_done=lambda result: self.search_done(name, on_done, result))
+
+    def search_done(self, name, on_done, result):
+        path, seconds = result
+        on_done(path)
+        if self.on_search is not None:
+            self.on_search(name, path, seconds)
 
     def run_bfs(self):
-        path = self.bfs()
+        if self.runner.cancel("BFS"):
+            self.lbl_status.config(text="BFS cancelled")
+            return
+        self.lbl_status.config(text="Running BFS...")
+        self.start_search("BFS", self.show_bfs)
+
+    def show_bfs(self, path):
         self.visualize_path(path, "blue")
         self.lbl_status.config(text=f"BFS found path with {len(path)-1} steps" if path else "BFS: No path found")
 
     def run_dfs(self):
-        path = self.dfs()
+        if self.runner.cancel("DFS"):
+            self.lbl_status.config(text="DFS cancelled")
+            return
+        self.lbl_status.config(text="Running DFS...")
+        self.start_search("DFS", self.show_dfs)
+
+    def show_dfs(self, path):
         self.visualize_path(path, "purple")
         self.lbl_status.config(text=f"DFS found path with {len(path)-1} steps" if path else "DFS: No path found")
 
     def run_both(self):
-        bfs_path = self.bfs()
-        dfs_path = self.dfs()
-
+        """BFS and DFS on two workers at once; clicking again cancels both"""
+        if self.runner.cancel("BFS") | self.runner.cancel("DFS"):
+            self.lbl_status.config(text="Search cancelled")
+            return
+        self.lbl_status.config(text="Running BFS and DFS...")
+        results = {}
+        def collect(name):
+            def done(path):
+                results[name] = path
+                if len(results) == 2:
+                    self.show_both(results["BFS"], results["DFS"])
+            return done
+        self.start_search("BFS", collect("BFS"))
+        self.start_search("DFS", collect("DFS"))
+
+    def show_both(self, bfs_path, dfs_path):
         self.visualize_path(bfs_path, "blue")
         self.visualize_path(dfs_path, "purple")
 
@@ -141,72 +305,102 @@ class PathfindingVisualizer:
         elif not bfs_path:
             self.lbl_status.config(text="BFS failed; DFS found path with {} steps".format(len(dfs_path)-1))
         else:
-            accuracy = ((len(bfs_path)-1) / (len(dfs_path)-1)) * 100 if len(dfs_path) != 0 else 0
+            accuracy = ((len(bfs_path)-1) / (len(dfs_path)-1)) * 100 if len(dfs_path) > 1 else 0
             self.lbl_status.config(
                 text=f"BFS: {len(bfs_path)-1} steps, DFS: {len(dfs_path)-1} steps, Accuracy: {accuracy:.2f}%"
             )
 
     def bfs(self):
-        queue = deque([(self.start, [self.start])])
-        visited = set()
+        if self.unreachable():
+            return None
+        if gridsearch is not None and self.rows * self.cols >= self.wavefront_min_cells:
+            return gridsearch.wavefront_bfs(self.maze, self.start, self.goal)
+        queue = deque([self.start])
+        parent = {self.start: None}
+        cancelled, on_expand = self.cancelled, self.on_expand
         while queue:
-            (r, c), path = queue.popleft()
+            if cancelled is not None and cancelled.is_set():
+                return None
+            r, c = queue.popleft()
+            if on_expand is not None:
+                on_expand((r, c))
             if (r, c) == self.goal:
-                return path
-            if (r, c) not in visited:
-                visited.add((r, c))
-                for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    nr, nc = r + dr, c + dc
-                    if (0 <= nr < self.rows and 0 <= nc < self.cols and 
-                        self.maze[nr][nc] == 0 and (nr, nc) not in visited):
-                        queue.append(((nr, nc), path + [(nr, nc)]))
+                return self.trace_path(parent)
+            for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                nr, nc = r + dr, c + dc
+                if (0 <= nr < self.rows and 0 <= nc < self.cols and 
+                    self.maze[nr][nc] == 0 and (nr, nc) not in parent):
+                    parent[(nr, nc)] = (r, c)
+                    queue.append((nr, nc))
         return None
 
     def dfs(self):
-        stack = [(self.start, [self.start])]
-        visited = set()
+        if self.unreachable():
+            return None
+        # Each entry remembers the cell it was pushed from; that becomes its
+        # parent the first time the cell is popped.
+        stack = [(self.start, None)]
+        parent = {}
+        cancelled, on_expand = self.cancelled, self.on_expand
         while stack:
-            (r, c), path = stack.pop()
+            if cancelled is not None and cancelled.is_set():
+                return None
+            (r, c), prev = stack.pop()
+            if (r, c) in parent:
+                continue
+            parent[(r, c)] = prev
+            if on_expand is not None:
+                on_expand((r, c))
             if (r, c) == self.goal:
-                return path
-            if (r, c) not in visited:
-                visited.add((r, c))
-                for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    nr, nc = r + dr, c + dc
-                    if (0 <= nr < self.rows and 0 <= nc < self.cols and 
-                        self.maze[nr][nc] == 0 and (nr, nc) not in visited):
-                        stack.append(((nr, nc), path + [(nr, nc)]))
+                return self.trace_path(parent)
+            for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                nr, nc = r + dr, c + dc
+                if (0 <= nr < self.rows and 0 <= nc < self.cols and 
+                    self.maze[nr][nc] == 0 and (nr, nc) not in parent):
+                    stack.append(((nr, nc), (r, c)))
         return None
 
+    def algorithm(self, name):
+        """searchcore engine `name` ("BFS", "DFS", "A*", ...) over the open
+        cells as they are now, e.g. for VisualWrapper to animate"""
+        if gridsearch is not None:
+            graph = searchcore.grid_graph(gridsearch.as_grid(self.maze))
+        else:
+            graph = searchcore.Graph()
+            for r in range(self.rows):
+                for c in range(self.cols):
+                    if self.maze[r][c]:
+                        continue
+                    graph.nodes.add((r, c))
+                    for dr, dc in DIRECTIONS:
+                        nr, nc = r + dr, c + dc
+                        if 0 <= nr < self.rows and 0 <= nc < self.cols and not self.maze[nr][nc]:
+                            graph.add_edge((r, c), (nr, nc))
+        return searchcore.ALGORITHMS[name](graph)
+
+    def solve(self, algo, start, goal):
+        copy = self.search_copy()
+        copy.start, copy.goal = start, goal
+        return getattr(copy, algo.lower())() or []
+
+    def trace_path(self, parent):
+        path = []
+        node = self.goal
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+        return path
+
     def visualize_path(self, path, color):
-        if not path:
-            return
-        cell_size = 500 // max(self.rows, self.cols)
+        """One reusable polyline per color (blue = BFS, purple = DFS), drawn
+        under the start and goal markers"""
         offset = 0
         if color == "blue":  # BFS
             offset = -3
         elif color == "purple":  # DFS
             offset = 3
-
-        for i in range(1, len(path)):
-            r1, c1 = path[i - 1]
-            r2, c2 = path[i]
-            x1 = c1 * cell_size + cell_size // 2
-            y1 = r1 * cell_size + cell_size // 2
-            x2 = c2 * cell_size + cell_size // 2
-            y2 = r2 * cell_size + cell_size // 2
-            self.canvas.create_line(x1 + offset, y1 + offset, x2 + offset, y2 + offset, fill=color, width=3)
-
-        # Redraw start and goal
-        r, c = self.start
-        x1, y1 = c * cell_size, r * cell_size
-        x2, y2 = x1 + cell_size, y1 + cell_size
-        self.canvas.create_oval(x1+5, y1+5, x2-5, y2-5, fill='green')
-
-        r, c = self.goal
-        x1, y1 = c * cell_size, r * cell_size
-        x2, y2 = x1 + cell_size, y1 + cell_size
-        self.canvas.create_oval(x1+5, y1+5, x2-5, y2-5, fill='red')
+        self.view.draw_path(color, path, color, offset)
 
 
 if __name__ == "__main__":
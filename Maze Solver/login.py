@@ -1,19 +1,21 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-import datetime
 import os
+import sys
 from visualizer import PathfindingVisualizer
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import actionlog
+
 # Simulated user database
 users = {
     "admin": "221",
     "guest": "cse"
 }
 
-# Save user actions for history
-def log_action(username, action):
-    with open("user_history.txt", "a") as f:
-        f.write(f"[{datetime.datetime.now()}] {username}: {action}\n")
+# Save user actions for history (queued; written by actionlog's background thread)
+def log_action(username, action, **fields):
+    actionlog.log(username, action, **fields)
 
 # Login window
 class LoginWindow:
@@ -57,20 +59,12 @@ def launch_visualizer(username):
     root = tk.Tk()
     app = PathfindingVisualizer(root)
 
-    # Wrap original methods to log user actions
-    original_bfs = app.run_bfs
-    original_dfs = app.run_dfs
-
-    def wrapped_bfs():
-        original_bfs()
-        log_action(username, "Ran BFS")
-
-    def wrapped_dfs():
-        original_dfs()
-        log_action(username, "Ran DFS")
+    # Log every finished search with its result
+    def log_search(algo, path, seconds):
+        log_action(username, f"Ran {algo}", algorithm=algo,
+                   path_length=len(path) - 1 if path else None, search_time=round(seconds, 6))
 
-    app.run_bfs = wrapped_bfs
-    app.run_dfs = wrapped_dfs
+    app.on_search = log_search
 
     root.mainloop()
 
@@ -1,7 +1,19 @@
 import tkinter as tk
 from tkinter import simpledialog, messagebox
-from visualizer import PathfindingVisualizer
-import time
+import importlib.util
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+import actionlog
+
+# PathfindingVisualizer lives in "import tkinter as tk.py", whose name
+# cannot be imported directly
+_spec = importlib.util.spec_from_file_location("maze_gui", os.path.join(HERE, "import tkinter as tk.py"))
+maze_gui = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(maze_gui)
+PathfindingVisualizer = maze_gui.PathfindingVisualizer
 
 # Dummy user database
 USERS = {
@@ -9,10 +21,9 @@ USERS = {
     "player2": "abc456"
 }
 
-# Log history function
-def log_history(username, action):
-    with open("user_history.txt", "a") as file:
-        file.write(f"{time.ctime()} | {username} | {action}\n")
+# Log history function (queued; written by actionlog's background thread)
+def log_history(username, action, **fields):
+    actionlog.log(username, action, **fields)
 
 # Login screen
 def login_screen():
@@ -47,17 +58,12 @@ def launch_visualizer(username):
     
     app = PathfindingVisualizer(root)
 
-    def run_bfs_wrapper():
-        log_history(username, "Ran BFS")
-        app.run_bfs()
-    
-    def run_dfs_wrapper():
-        log_history(username, "Ran DFS")
-        app.run_dfs()
+    # Log every finished search (BFS, DFS or both) with its result
+    def log_search(algo, path, seconds):
+        log_history(username, f"Ran {algo}", algorithm=algo,
+                    path_length=len(path) - 1 if path else None, search_time=round(seconds, 6))
 
-    # Overwrite button functions to log actions
-    app.btn_bfs.config(command=run_bfs_wrapper)
-    app.btn_dfs.config(command=run_dfs_wrapper)
+    app.on_search = log_search
 
     root.mainloop()
 
@@ -1,167 +1,70 @@
-import heapq
-import time
-import random
-import matplotlib.pyplot as plt
-import networkx as nx
-from collections import deque
-import tkinter as tk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-# --------------------------
-# 1. CORE GRAPH & ALGORITHMS
-# --------------------------
-class Graph:
-    def __init__(self):
-        self.nodes = set()
-        self.edges = {}
-        self.pos = {}  # For visualization
-    
-    def add_edge(self, u, v, cost=1):
-        if u not in self.edges:
-            self.edges[u] = []
-        self.edges[u].append((v, cost))
-        self.nodes.update([u, v])
-    
-    def set_positions(self, pos_dict):
-        self.pos = pos_dict
-
-class SearchAlgorithm:
-    def __init__(self, graph):
-        self.graph = graph
-        self.visited = set()
-        self.path = []
-        self.time_taken = 0
-    
-    def search(self, start, goal):
-        raise NotImplementedError
-
-class BFS(SearchAlgorithm):
-    def search(self, start, goal):
-        start_time = time.time()
-        queue = deque([(start, [start])])
-        
-        while queue:
-            node, path = queue.popleft()
-            if node == goal:
-                self.time_taken = time.time() - start_time
-                self.path = path
-                return path
-            if node not in self.visited:
-                self.visited.add(node)
-                for neighbor, _ in self.graph.edges.get(node, []):
-                    queue.append((neighbor, path + [neighbor]))
-        return []
-
-class DFS(SearchAlgorithm):
-    def search(self, start, goal):
-        start_time = time.time()
-        stack = [(start, [start])]
-        
-        while stack:
-            node, path = stack.pop()
-            if node == goal:
-                self.time_taken = time.time() - start_time
-                self.path = path
-                return path
-            if node not in self.visited:
-                self.visited.add(node)
-                for neighbor, _ in reversed(self.graph.edges.get(node, [])):
-                    stack.append((neighbor, path + [neighbor]))
-        return []
-
-class AStar(SearchAlgorithm):
-    def heuristic(self, a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])  # Manhattan distance
-    
-    def search(self, start, goal):
-        start_time = time.time()
-        open_set = []
-        heapq.heappush(open_set, (0, start, [start]))
-        
-        while open_set:
-            _, node, path = heapq.heappop(open_set)
-            if node == goal:
-                self.time_taken = time.time() - start_time
-                self.path = path
-                return path
-            if node not in self.visited:
-                self.visited.add(node)
-                for neighbor, cost in self.graph.edges.get(node, []):
-                    new_path = path + [neighbor]
-                    heapq.heappush(open_set, (
-                        len(new_path) + self.heuristic(neighbor, goal),
-                        neighbor,
-                        new_path
-                    ))
-        return []
-
-# --------------------------
-# 2. REAL-WORLD APPLICATIONS
-# --------------------------
-def generate_maze(rows, cols, obstacle_prob=0.3):
-    maze = Graph()
-    for r in range(rows):
-        for c in range(cols):
-            if random.random() > obstacle_prob:
-                for dr, dc in [(0,1), (1,0)]:
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < rows and 0 <= nc < cols:
-                        maze.add_edge((r,c), (nr,nc))
-    # Assign grid positions for visualization
-    pos = {(r,c): (c, -r) for r in range(rows) for c in range(cols)}
-    maze.set_positions(pos)
-    return maze
+import weakref
+from searchcore import (
+    Graph, CSRGraph, SearchAlgorithm, BFS, DFS, AStar, BidirectionalBFS, BidirectionalAStar,
+    manhattan, octile, euclidean, zero, SQRT2, HEURISTICS,
+    ShortestPathTree, shortest_path_tree, one_to_many, many_to_many,
+    generate_maze, generate_grid_maze, grid_graph, ALGORITHMS, time_search
+)
+from searchworker import SearchRunner
+# matplotlib, tkinter and graphplot are imported where they are first used,
+# so importing this file for the searches alone stays fast
 
 # --------------------------
 # 3. VISUALIZATION & ANALYSIS
 # --------------------------
+_plots = weakref.WeakKeyDictionary()  # graph -> GraphPlot of its open figure
+
 def visualize_graph(graph, path=None, title="Graph Visualization"):
-    G = nx.Graph()
-    for node in graph.nodes:
-        G.add_node(node)
-    for u in graph.edges:
-        for v, cost in graph.edges[u]:
-            G.add_edge(u, v, weight=cost)
-    
-    plt.figure(figsize=(10, 8))
-    pos = graph.pos if graph.pos else nx.spring_layout(G)
-    
-    nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=500)
-    if path:
-        nx.draw_networkx_nodes(G, pos, nodelist=path, node_color='red')
-        path_edges = list(zip(path[:-1], path[1:]))
-        nx.draw_networkx_edges(G, pos, edgelist=path_edges, edge_color='red', width=2)
-    plt.title(title)
+    """Plot a graph and highlight a path; the figure for a graph is built
+    once and reused while it stays open"""
+    import matplotlib.pyplot as plt
+    from graphplot import GraphPlot
+
+    plot = _plots.get(graph)
+    if plot is None or not plot.current(graph) or not plt.fignum_exists(plot.ax.figure.number):
+        fig, ax = plt.subplots(figsize=(10, 8))
+        plot = _plots[graph] = GraphPlot(ax, graph, node_size=500)
+    plot.show_path(path, title)
     plt.show()
 
-def compare_algorithms(graph, start, goal):
+def compare_algorithms(graph, start, goal, repeat=5, plot=True):
+    """Median time, path length and work of each search; bar charts if plot.
+
+    For sweeps over sizes, densities and seeds use bench_search.py.
+    """
     results = {}
-    algorithms = {
-        "BFS": BFS(graph),
-        "DFS": DFS(graph),
-        "A*": AStar(graph)
-    }
-    
-    for name, algo in algorithms.items():
-        algo.search(start, goal)
+    graph.compact()  # build the CSR arrays before any timing starts
+    for name, cls in ALGORITHMS.items():
+        algo = cls(graph)
+        timings = sorted(time_search(algo, start, goal, repeat))
         results[name] = {
-            "time": algo.time_taken,
+            "time": timings[len(timings) // 2] / 1e9,
             "path_length": len(algo.path),
+            "expanded": algo.expanded,
+            "max_frontier": algo.max_frontier,
             "path": algo.path
         }
+    if not plot:
+        return results
+    import matplotlib.pyplot as plt
     
     # Plot comparison
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(16, 5))
     names = list(results.keys())
     times = [results[name]["time"] for name in names]
     lengths = [results[name]["path_length"] for name in names]
+    expanded = [results[name]["expanded"] for name in names]
+    colors = ['skyblue', 'lightgreen', 'salmon', 'plum', 'khaki']
     
-    ax1.bar(names, times, color=['skyblue', 'lightgreen', 'salmon'])
+    ax1.bar(names, times, color=colors)
     ax1.set_title("Time Taken (seconds)")
     
-    ax2.bar(names, lengths, color=['skyblue', 'lightgreen', 'salmon'])
+    ax2.bar(names, lengths, color=colors)
     ax2.set_title("Path Length (nodes)")
     
+    ax3.bar(names, expanded, color=colors)
+    ax3.set_title("Nodes Expanded")
+    
     plt.tight_layout()
     plt.show()
     
@@ -171,9 +74,18 @@ def compare_algorithms(graph, start, goal):
 # 4. INTERACTIVE GUI (Tkinter)
 # --------------------------
 class PathfindingApp:
+    # Searches report progress (and can be cancelled) every this many expansions
+    progress_every = 2000
+
     def __init__(self, root):
+        import tkinter as tk
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         self.root = root
         self.root.title("AI Pathfinding Visualizer")
+        self.runner = SearchRunner(root)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         
         self.frame = tk.Frame(root)
         self.frame.pack(pady=10)
@@ -190,6 +102,12 @@ class PathfindingApp:
         self.btn_astar = tk.Button(self.frame, text="Run A*", command=lambda: self.run_algorithm("A*"))
         self.btn_astar.pack(side=tk.LEFT, padx=5)
         
+        self.btn_open = tk.Button(self.frame, text="Open Maze", command=self.open_maze)
+        self.btn_open.pack(side=tk.LEFT, padx=5)
+        
+        self.lbl_status = tk.Label(self.frame, text="Ready")
+        self.lbl_status.pack(side=tk.LEFT, padx=10)
+        
         self.canvas_frame = tk.Frame(root)
         self.canvas_frame.pack()
         
@@ -198,14 +116,60 @@ class PathfindingApp:
         self.canvas.get_tk_widget().pack()
         
         self.graph = None
+        self.plot = None  # GraphPlot of self.graph, rebuilt with the maze
         self.start = (0, 0)
         self.goal = (9, 9)
     
+    def close(self):
+        self.runner.shutdown()
+        self.root.destroy()
+    
     def generate_maze(self):
+        self.runner.cancel()  # results for the old maze are no longer wanted
         self.graph = generate_maze(10, 10)
         self.visualize_graph("Generated Maze")
     
+    def open_maze(self, path=None):
+        """Load a bit-packed .maze file (see mazefile.py) as a grid graph"""
+        import mazefile
+        from tkinter import filedialog, messagebox
+
+        path = path or filedialog.askopenfilename(filetypes=[("Maze files", "*.maze"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            with mazefile.load(path) as saved:
+                rows, cols = saved.rows, saved.cols
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Open Maze", str(error))
+            return
+        # at least one pixel of the plot per cell
+        box = self.ax.get_window_extent()
+        if rows > box.height or cols > box.width:
+            messagebox.showerror("Open Maze", f"{rows}x{cols} is too large to display")
+            return
+        
+        def work(job):
+            with mazefile.load(path) as saved:
+                graph = grid_graph(saved.to_grid())
+                start, goal = saved.start, saved.goal
+            graph.components()  # so the first search starts at once
+            return graph, start, goal
+        
+        def done(loaded):
+            self.graph, self.start, self.goal = loaded
+            self.visualize_graph(f"Opened {path}")
+        
+        self.runner.cancel()
+        self.lbl_status.config(text="Opening maze...")
+        self.runner.submit("Open", work, on_done=done,
+                           on_error=lambda error: messagebox.showerror("Open Maze", str(error)))
+    
     def run_algorithm(self, algo_name):
+        """Search on a worker thread; clicking the same button again cancels it"""
+        if self.runner.cancel(algo_name):
+            self.lbl_status.config(text=f"{algo_name} cancelled")
+            return
         if not self.graph:
             self.generate_maze()
         
@@ -216,33 +180,33 @@ class PathfindingApp:
         else:
             algo = AStar(self.graph)
         
-        path = algo.search(self.start, self.goal)
-        self.visualize_graph(f"{algo_name} Path", path)
+        def work(job):
+            # the expand hook doubles as progress report and cancellation point
+            algo.instrument(on_expand=lambda node: job.report(algo.expanded), sample=self.progress_every)
+            return algo.search(self.start, self.goal)
+        
+        def done(path):
+            self.lbl_status.config(text=f"{algo_name}: {algo.expanded} expanded, {algo.time_taken:.3f}s")
+            self.visualize_graph(f"{algo_name} Path", path)
+        
+        self.lbl_status.config(text=f"Running {algo_name}...")
+        self.runner.submit(algo_name, work, on_done=done,
+                           on_progress=lambda n: self.lbl_status.config(text=f"{algo_name}: {n} expanded..."))
     
     def visualize_graph(self, title, path=None):
-        self.ax.clear()
-        G = nx.Graph()
-        for node in self.graph.nodes:
-            G.add_node(node)
-        for u in self.graph.edges:
-            for v, _ in self.graph.edges[u]:
-                G.add_edge(u, v)
-        
-        pos = self.graph.pos
-        nx.draw(G, pos, ax=self.ax, with_labels=True, node_color='lightblue', node_size=300)
-        if path:
-            nx.draw_networkx_nodes(G, pos, nodelist=path, ax=self.ax, node_color='red')
-            path_edges = list(zip(path[:-1], path[1:]))
-            nx.draw_networkx_edges(G, pos, edgelist=path_edges, ax=self.ax, edge_color='red', width=2)
-        
-        self.ax.set_title(title)
-        self.canvas.draw()
+        from graphplot import GraphPlot
+
+        if self.plot is None or not self.plot.current(self.graph):
+            self.plot = GraphPlot(self.ax, self.graph)
+        self.plot.show_path(path, title)
+        self.canvas.draw_idle()
 
 # --------------------------
 # MAIN EXECUTION
 # --------------------------
 if __name__ == "__main__":
     # Option 1: Run GUI
+    import tkinter as tk
     root = tk.Tk()
     app = PathfindingApp(root)
     root.mainloop()
@@ -250,4 +214,5 @@ if __name__ == "__main__":
     # Option 2: Run console-based analysis
     # maze = generate_maze(10, 10)
     # visualize_graph(maze)
-    # compare_algorithms(maze, (0,0), (9,9))
\ No newline at end of file
+    # compare_algorithms(maze, (0,0), (9,9))
+    # (sweeps over sizes, densities and seeds: python bench_search.py --help)
\ No newline at end of file
@@ -0,0 +1,119 @@
+# --------------------------
+# BUFFERED ACTION LOG (JSONL)
+# --------------------------
+# One background thread owns the log file. Callers only put a record on a
+# queue, so logging from the Tk thread never waits on disk. The writer takes
+# whatever has queued up, writes it as one batch of JSON lines and rotates
+# the file by size (user_history.jsonl -> .1 -> .2 ...). Whatever is still
+# queued is written when the interpreter exits.
+#
+#   import actionlog
+#   actionlog.log("admin", "Ran BFS", algorithm="BFS", path_length=18, search_time=0.004)
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+
+DEFAULT_PATH = "user_history.jsonl"
+
+
+class ActionLogger:
+    def __init__(self, path=DEFAULT_PATH, max_bytes=1 << 20, backups=3, batch=512):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.batch = batch
+        self.records = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def log(self, user, action, **fields):
+        """Queue one record; extra fields (algorithm, path_length, search_time, ...)
+        are stored as given, None values are left out"""
+        record = {"time": round(time.time(), 3), "user": user, "action": action}
+        record.update((key, value) for key, value in fields.items() if value is not None)
+        self._start()
+        self.records.put(record)
+
+    def flush(self, timeout=5.0):
+        """Block until everything queued so far is on disk"""
+        if self.thread is None or self.closed:
+            return True
+        done = threading.Event()
+        self.records.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self.thread is not None and not self.closed:
+            self.closed = True
+            self.records.put(None)
+            self.thread.join(5.0)
+
+    def _start(self):
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self._run, name="actionlog", daemon=True)
+                    self.thread.start()
+                    atexit.register(self.close)
+
+    def _run(self):
+        f = open(self.path, "a", encoding="utf-8")
+        try:
+            while True:
+                items = [self.records.get()]
+                while len(items) < self.batch:
+                    try:
+                        items.append(self.records.get_nowait())
+                    except queue.Empty:
+                        break
+                # json.dumps output is ASCII, so len() is the size in bytes
+                size, chunk = f.tell(), []
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    line = json.dumps(item) + "\n"
+                    if size and size + len(line) > self.max_bytes:
+                        f.write("".join(chunk))
+                        f.close()
+                        self._rotate()
+                        f = open(self.path, "a", encoding="utf-8")
+                        size, chunk = 0, []
+                    chunk.append(line)
+                    size += len(line)
+                if chunk:
+                    f.write("".join(chunk))
+                    f.flush()
+                for item in items:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                if None in items:
+                    return
+        finally:
+            f.close()
+
+    def _rotate(self):
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+_default = None
+
+def get_logger():
+    """The shared logger for user_history.jsonl in the working directory"""
+    global _default
+    if _default is None:
+        _default = ActionLogger()
+    return _default
+
+def log(user, action, **fields):
+    get_logger().log(user, action, **fields)
@@ -0,0 +1,281 @@
+# --------------------------
+# ARFF DATASETS (COLUMNAR)
+# --------------------------
+# Reads Weka ARFF files such as weather.arff and hayes-roth_train.arff into
+# NumPy columns: numeric attributes (real / numeric / integer) become
+# float64 arrays with NaN for a missing "?", nominal attributes become
+# small integer codes into the declared values with -1 for "?". String and
+# date attributes are coded the same way, against the values in the order
+# they first appear.
+#
+# The @data section is read and converted a chunk of rows at a time, so a
+# large file is never held as lines. load() keeps the parsed columns in a
+# sidecar file (weather.arff -> weather.arff.npz) and uses it instead of
+# parsing again for as long as the .arff is unchanged.
+#
+#   data = load("weather.nominal.arff")
+#   data["outlook"]                # array([0, 0, 1, 2, ...], dtype=int8)
+#   data.labels("play")            # ['no', 'no', 'yes', ...]
+#   for chunk in iter_chunks("big.arff", chunk_rows=100000): ...
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+MISSING = "?"
+MISSING_NUMBER = "nan"
+NUMERIC_TYPES = ("numeric", "real", "integer")
+CACHE_VERSION = 1
+
+# kind is "numeric", "nominal", "string" or "date"; values are the nominal
+# labels (or the strings seen so far), None for numeric attributes
+Attribute = namedtuple("Attribute", "name kind values")
+
+
+class Dataset:
+    """The columns of one ARFF file, by attribute name"""
+    def __init__(self, relation, attributes, columns):
+        self.relation = relation
+        self.attributes = attributes
+        self.columns = columns
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    @property
+    def names(self):
+        return [attr.name for attr in self.attributes]
+
+    def attribute(self, name):
+        for attr in self.attributes:
+            if attr.name == name:
+                return attr
+        raise KeyError(name)
+
+    def labels(self, name):
+        """A coded column decoded back to its values (None where missing)"""
+        values = self.attribute(name).values
+        return [values[code] if code >= 0 else None for code in self.columns[name].tolist()]
+
+
+def split_values(line):
+    """Comma-separated values of one line; '...' and "..." may hold commas"""
+    if "'" not in line and '"' not in line:
+        return [value.strip() for value in line.split(",")]
+    values = []
+    i, n = 0, len(line)
+    while True:
+        while i < n and line[i] in " \t":
+            i += 1
+        if i < n and line[i] in "'\"":
+            quote, i = line[i], i + 1
+            chars = []
+            while i < n and line[i] != quote:
+                if line[i] == "\\" and i + 1 < n:
+                    i += 1
+                chars.append(line[i])
+                i += 1
+            if i >= n:
+                raise ValueError(f"unterminated quote in {line!r}")
+            value = "".join(chars)
+            i += 1
+            while i < n and line[i] in " \t":
+                i += 1
+            if i < n and line[i] != ",":
+                raise ValueError(f"text after a quoted value in {line!r}")
+        else:
+            j = line.find(",", i)
+            j = n if j < 0 else j
+            value = line[i:j].strip()
+            i = j
+        values.append(value)
+        if i >= n:
+            return values
+        i += 1
+
+def _parse_attribute(rest):
+    """Attribute from the text after @attribute"""
+    rest = rest.strip()
+    if rest[:1] in ("'", '"'):
+        end = rest.index(rest[0], 1)
+        name, rest = rest[1:end], rest[end + 1:].strip()
+    else:
+        name, _, rest = rest.partition(" ") if " " in rest else rest.partition("\t")
+        rest = rest.strip()
+    if rest.startswith("{"):
+        return Attribute(name, "nominal", split_values(rest[1:rest.rindex("}")]))
+    kind = rest.split()[0].lower() if rest else ""
+    if kind in NUMERIC_TYPES:
+        return Attribute(name, "numeric", None)
+    if kind in ("string", "date"):
+        return Attribute(name, kind, [])
+    raise ValueError(f"unsupported type for attribute {name!r}: {rest!r}")
+
+def _read_header(f):
+    """Read up to and including @data; returns (relation, attributes, line number)"""
+    relation, attributes = None, []
+    for lineno, line in enumerate(f, 1):
+        line = line.strip()
+        if not line or line.startswith("%"):
+            continue
+        keyword, _, rest = line.partition(" ")
+        keyword = keyword.lower()
+        if keyword == "@relation":
+            relation = rest.strip().strip("'\"")
+        elif keyword == "@attribute":
+            attributes.append(_parse_attribute(rest))
+        elif keyword == "@data":
+            return relation, attributes, lineno
+        else:
+            raise ValueError(f"line {lineno}: unexpected {line!r} in the header")
+    raise ValueError("no @data section")
+
+def _code_dtype(count):
+    return np.int8 if count < 127 else np.int16 if count < 32767 else np.int32
+
+def _convert(attr, tokens):
+    """One column of a chunk as an array; string vocabularies grow in place"""
+    if attr.kind == "numeric":
+        try:
+            return np.array(tokens, dtype=np.float64)
+        except ValueError:
+            pass
+        try:
+            return np.array([MISSING_NUMBER if token == MISSING else token for token in tokens], dtype=np.float64)
+        except ValueError:
+            raise ValueError(f"non-numeric value in numeric attribute {attr.name!r}") from None
+    index = {value: code for code, value in enumerate(attr.values)}
+    index[MISSING] = -1
+    try:
+        codes = [index[token] for token in tokens]
+    except KeyError as e:
+        if attr.kind == "nominal":
+            raise ValueError(f"{e.args[0]!r} is not a declared value of attribute {attr.name!r}") from None
+        for token in tokens:
+            if token not in index:
+                index[token] = len(attr.values)
+                attr.values.append(token)
+        codes = [index[token] for token in tokens]
+    return np.array(codes, dtype=_code_dtype(len(attr.values)))
+
+def _split_chunk(lines, linenos, n):
+    """The values of a chunk of data lines, column by column"""
+    text = ",".join(lines)
+    if "'" not in text and '"' not in text:
+        # No quoting anywhere: one split for the whole chunk, as long as
+        # every line has its n values (ragged rows could balance out)
+        if all(line.count(",") == n - 1 for line in lines):
+            tokens = text.split(",")
+            if " " in text or "\t" in text:
+                tokens = [token.strip() for token in tokens]
+            return [tokens[j::n] for j in range(n)]
+    rows = []
+    for line, lineno in zip(lines, linenos):
+        values = split_values(line)
+        if len(values) != n:
+            raise ValueError(f"line {lineno}: {len(values)} values, expected {n}")
+        rows.append(values)
+    return [list(column) for column in zip(*rows)]
+
+def _chunks(f, n, chunk_rows, lineno):
+    """(lines, line numbers) of the @data section, chunk_rows lines at a time"""
+    lines, linenos = [], []
+    for lineno, line in enumerate(f, lineno + 1):
+        line = line.strip()
+        if not line or line.startswith("%"):
+            continue
+        if line.startswith("{"):
+            raise ValueError(f"line {lineno}: sparse ARFF rows are not supported")
+        lines.append(line)
+        linenos.append(lineno)
+        if len(lines) == chunk_rows:
+            yield lines, linenos
+            lines, linenos = [], []
+    if lines:
+        yield lines, linenos
+
+def iter_chunks(path, chunk_rows=65536, header=None):
+    """Yield {name: array} for every chunk_rows rows of the @data section.
+
+    header, if given, is a list that receives (relation, attributes) once
+    the header has been read.
+    """
+    with open(path, encoding="utf-8") as f:
+        relation, attributes, lineno = _read_header(f)
+        if header is not None:
+            header.append((relation, attributes))
+        for lines, linenos in _chunks(f, len(attributes), chunk_rows, lineno):
+            columns = _split_chunk(lines, linenos, len(attributes))
+            yield {attr.name: _convert(attr, column) for attr, column in zip(attributes, columns)}
+
+def parse(path, chunk_rows=65536):
+    """Dataset read straight from the .arff, ignoring any cache"""
+    header = []
+    parts = list(iter_chunks(path, chunk_rows, header))
+    relation, attributes = header[0]
+    columns = {}
+    for attr in attributes:
+        pieces = [part[attr.name] for part in parts]
+        if attr.kind == "numeric":
+            empty = np.empty(0, dtype=np.float64)
+        else:
+            # codes of early chunks may use a narrower type than later ones
+            empty = np.empty(0, dtype=_code_dtype(len(attr.values)))
+        columns[attr.name] = np.concatenate(pieces + [empty]).astype(empty.dtype, copy=False)
+    return Dataset(relation, attributes, columns)
+
+
+# --------------------------
+# BINARY SIDECAR CACHE
+# --------------------------
+def cache_path(path):
+    return path + ".npz"
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+def _read_cache(path):
+    sidecar = cache_path(path)
+    try:
+        with np.load(sidecar, allow_pickle=False) as saved:
+            meta = json.loads(str(saved["header"]))
+            if meta["version"] != CACHE_VERSION or meta["source"] != _source_stamp(path):
+                return None
+            attributes = [Attribute(name, kind, values) for name, kind, values in meta["attributes"]]
+            columns = {attr.name: saved[f"c{i}"] for i, attr in enumerate(attributes)}
+    except (OSError, KeyError, ValueError):
+        return None
+    return Dataset(meta["relation"], attributes, columns)
+
+def _write_cache(path, data):
+    meta = {
+        "version": CACHE_VERSION,
+        "source": _source_stamp(path),
+        "relation": data.relation,
+        "attributes": [list(attr) for attr in data.attributes],
+    }
+    arrays = {f"c{i}": data.columns[attr.name] for i, attr in enumerate(data.attributes)}
+    sidecar = cache_path(path)
+    tmp = sidecar + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, header=np.array(json.dumps(meta)), **arrays)
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass  # a read-only data directory just means no cache
+
+def load(path, chunk_rows=65536, cache=True):
+    """Dataset for an .arff file, from its sidecar cache when that is current"""
+    if cache:
+        data = _read_cache(path)
+        if data is not None:
+            return data
+    data = parse(path, chunk_rows)
+    if cache:
+        _write_cache(path, data)
+    return data
@@ -0,0 +1,66 @@
+"""Expanded nodes and time of A* on generate_maze() grids.
+
+The old A* (ranked by path length + heuristic, ties broken by comparing
+node tuples, edge costs ignored) is kept below as the reference.
+
+    python bench_astar.py --sizes 50 100 200 --seeds 0 1 2
+"""
+import argparse
+import heapq
+import random
+import time
+
+import searchcore as core
+
+def reference_astar(graph, start, goal):
+    """Returns (path, expanded) for the A* as it was before g-scores"""
+    def heuristic(a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    visited = set()
+    open_set = [(0, start, [start])]
+    while open_set:
+        _, node, path = heapq.heappop(open_set)
+        if node == goal:
+            return path, len(visited)
+        if node not in visited:
+            visited.add(node)
+            for neighbor, cost in graph.edges.get(node, []):
+                new_path = path + [neighbor]
+                heapq.heappush(open_set, (len(new_path) + heuristic(neighbor, goal), neighbor, new_path))
+    return [], len(visited)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--obstacles", type=float, default=0.2)
+    args = parser.parse_args()
+
+    variants = [
+        ("A* manhattan", dict(heuristic="manhattan")),
+        ("A* octile", dict(heuristic="octile")),
+        ("A* euclidean", dict(heuristic="euclidean")),
+        ("Dijkstra (zero)", dict(heuristic="zero")),
+        ("A* manhattan w=2", dict(heuristic="manhattan", weight=2.0)),
+    ]
+    print(f"{'size':>5} {'seed':>5} {'search':<18} {'expanded':>9} {'path':>6} {'seconds':>9}")
+    for size in args.sizes:
+        for seed in args.seeds:
+            random.seed(seed)
+            graph = core.generate_maze(size, size, args.obstacles)
+            graph.compact()
+            start, goal = (0, 0), (size - 1, size - 1)
+
+            t = time.perf_counter()
+            path, expanded = reference_astar(graph, start, goal)
+            elapsed = time.perf_counter() - t
+            print(f"{size:>5} {seed:>5} {'old A*':<18} {expanded:>9} {len(path):>6} {elapsed:9.4f}")
+            for name, kwargs in variants:
+                astar = core.AStar(graph, **kwargs)
+                t = time.perf_counter()
+                path = astar.search(start, goal)
+                elapsed = time.perf_counter() - t
+                print(f"{size:>5} {seed:>5} {name:<18} {astar.expanded:>9} {len(path):>6} {elapsed:9.4f}")
+
+if __name__ == "__main__":
+    main()
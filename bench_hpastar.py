@@ -0,0 +1,97 @@
+"""Query latency and path error of HPAStar against plain A* on generate_grid_maze() grids.
+
+For each grid size the same random start/goal pairs (in one component)
+go through A* once and through HPA* for every cluster size. Reported per
+cluster size: the time to build all cluster tables, median and 95th
+percentile query latency, the speedup of the median over A*, how much
+longer HPA*'s paths are (mean and worst, in percent) and the time the
+lazy rebuild takes after a few cells are toggled.
+
+    python bench_hpastar.py --sizes 128 256 --cluster-sizes 8 16 32
+    python bench_hpastar.py --sizes 255 --algorithm backtracker
+    python bench_hpastar.py --sizes 1024 --cluster-sizes 16 --processes 4 --queries 20
+"""
+import argparse
+import random
+import statistics
+import time
+
+import numpy as np
+
+import searchcore as core
+from hpastar import HPAStar
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def random_pairs(graph, count, rng):
+    csr = graph.compact()
+    opens = [tuple(cell) for cell in np.argwhere(graph.grid == 0).tolist()]
+    comps = csr.components()
+    pairs = []
+    while len(pairs) < count:
+        a, b = rng.choice(opens), rng.choice(opens)
+        if a != b and comps.same(csr.id_of(a), csr.id_of(b)):
+            pairs.append((a, b))
+    return pairs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[128, 256])
+    parser.add_argument("--cluster-sizes", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--obstacles", type=float, default=0.3)
+    parser.add_argument("--algorithm", default="random", help="maze generator, see mazegen.GENERATORS")
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--edits", type=int, default=5, help="cells toggled before timing the lazy rebuild")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes for the cluster tables")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'size':>5} {'cluster':>7} {'build s':>8} {'p50 ms':>8} {'p95 ms':>8} {'A* p50':>8} "
+          f"{'speedup':>8} {'err %':>6} {'max %':>6} {'rebuild ms':>10} {'tables':>6}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        graph = core.generate_grid_maze(size, size, args.obstacles, seed=args.seed, algorithm=args.algorithm)
+        pairs = random_pairs(graph, args.queries, rng)
+        astar = core.AStar(graph)
+        exact = []
+        for start, goal in pairs:
+            seconds, _ = timed(astar.search, start, goal)
+            exact.append((seconds, astar.cost))
+        astar_p50 = statistics.median(seconds for seconds, _ in exact)
+
+        grid = graph.grid.copy()
+        cells = [(rng.randrange(size), rng.randrange(size)) for _ in range(args.edits)]
+        for cell in cells:
+            grid[cell] ^= 1
+        edited = core.grid_graph(grid)
+
+        for cluster_size in args.cluster_sizes:
+            planner = HPAStar(graph, cluster_size, processes=args.processes)
+            build = planner.build()
+            latencies, errors = [], []
+            for (start, goal), (_, cost) in zip(pairs, exact):
+                seconds, _ = timed(planner.search, start, goal)
+                latencies.append(seconds)
+                errors.append(planner.cost / cost - 1)
+            p50 = statistics.median(latencies)
+
+            planner.graph = edited
+            planner.invalidate(cells)
+            rebuild = planner.build()
+            planner.graph = graph  # back to the original map for the next cluster size
+
+            print(f"{size:>5} {cluster_size:>7} {build:8.2f} {p50 * 1e3:8.2f} "
+                  f"{percentile(latencies, 0.95) * 1e3:8.2f} {astar_p50 * 1e3:8.2f} {astar_p50 / p50:7.1f}x "
+                  f"{100 * statistics.mean(errors):6.2f} {100 * max(errors):6.1f} {rebuild * 1e3:10.1f} "
+                  f"{planner.rebuilt:>6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Training, prediction and cross-validation time of the vectorized Naive Bayes.
+
+Draws a synthetic data set (nominal features sampled from per-class
+distributions, one of them with --wide values, Gaussian numeric ones, a
+few missing values), then times NaiveBayes.fit() and batch prediction on
+all of it, a per-row Python implementation on the first --reference-rows
+rows (its predictions must agree), and k-fold cross-validation in this
+process and in a pool.
+
+    python bench_naivebayes.py                       # 10^6 rows
+    python bench_naivebayes.py --rows 100000 --folds 10 --processes 4
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from naivebayes import NaiveBayes, cross_validate
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def synthetic(rows, classes=3, nominal=8, values=5, wide=100, numeric=2, missing=0.01, seed=0):
+    """{name: column} with class codes in "class"; -1 / NaN mark missing values.
+    The last nominal feature has `wide` values, more than int8 class * value fits"""
+    rng = np.random.default_rng(seed)
+    y = rng.integers(classes, size=rows)
+    columns = {}
+    for j in range(nominal):
+        count = wide if wide and j == nominal - 1 else values
+        cumulative = np.cumsum(rng.dirichlet(np.ones(count), size=classes), axis=1)
+        x = (rng.random(rows)[:, None] > cumulative[y]).sum(axis=1).astype(np.int8)
+        x[rng.random(rows) < missing] = -1
+        columns[f"n{j}"] = x
+    for j in range(numeric):
+        centres = rng.normal(50, 10, size=classes)
+        x = rng.normal(centres[y], 15)
+        x[rng.random(rows) < missing] = np.nan
+        columns[f"x{j}"] = x
+    columns["class"] = y.astype(np.int8)
+    return columns
+
+def reference_predict(columns, target, rows, alpha=1.0):
+    """Count and score row by row, as the lab sheets do it by hand"""
+    names = [name for name in columns if name != target]
+    data = {name: columns[name][:rows].tolist() for name in columns}
+    classes = max(data[target]) + 1
+    class_counts = [0] * classes
+    counts = {name: {} for name in names}
+    sums = {name: [[0.0, 0.0, 0] for _ in range(classes)] for name in names}
+    for i in range(rows):
+        k = data[target][i]
+        class_counts[k] += 1
+        for name in names:
+            v = data[name][i]
+            if isinstance(v, float):
+                if not math.isnan(v):
+                    s = sums[name][k]
+                    s[0] += v
+                    s[1] += v * v
+                    s[2] += 1
+            elif v >= 0:
+                counts[name][k, v] = counts[name].get((k, v), 0) + 1
+    sizes = {name: max(data[name]) + 1 for name in names if not isinstance(data[name][0], float)}
+    seen = {name: [sum(c for (k, _), c in counts[name].items() if k == cls) for cls in range(classes)]
+            for name in sizes}
+    predictions = []
+    for i in range(rows):
+        best, best_score = -1, -math.inf
+        for k in range(classes):
+            score = math.log((class_counts[k] + alpha) / (rows + alpha * classes))
+            for name in names:
+                v = data[name][i]
+                if name in sizes:
+                    if v >= 0:
+                        score += math.log((counts[name].get((k, v), 0) + alpha) / (seen[name][k] + alpha * sizes[name]))
+                elif not math.isnan(v):
+                    total, squares, n = sums[name][k]
+                    mean = total / n
+                    var = squares / n - mean * mean
+                    score -= 0.5 * (math.log(2 * math.pi * var) + (v - mean) ** 2 / var)
+            if score > best_score:
+                best, best_score = k, score
+        predictions.append(best)
+    return predictions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10 ** 6)
+    parser.add_argument("--reference-rows", type=int, default=20000,
+                        help="rows to also run the per-row implementation on (0 to skip)")
+    parser.add_argument("--folds", type=int, default=10)
+    parser.add_argument("--processes", type=int, default=4, help="pool size for the parallel cross-validation")
+    parser.add_argument("--wide", type=int, default=100, help="values of the widest nominal feature (0 for none)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    columns = synthetic(args.rows, wide=args.wide, seed=args.seed)
+    t_fit, model = timed(NaiveBayes().fit, columns, "class")
+    t_predict, predicted = timed(model.predict, columns)
+    accuracy = float((predicted == columns["class"]).mean())
+    print(f"{args.rows} rows, {len(columns) - 1} features: fit {t_fit:.3f} s, predict {t_predict:.3f} s "
+          f"({args.rows / t_predict:,.0f} rows/s), training accuracy {accuracy:.3f}")
+
+    if args.reference_rows:
+        n = min(args.reference_rows, args.rows)
+        subset = {name: column[:n] for name, column in columns.items()}
+        t_vec, _ = timed(lambda: NaiveBayes().fit(subset, "class").predict(subset))
+        t_ref, ref = timed(reference_predict, columns, "class", n)
+        agree = float((NaiveBayes().fit(subset, "class").predict(subset) == np.array(ref)).mean())
+        print(f"per-row fit + predict on {n} rows: {t_ref:.3f} s vs {t_vec:.4f} s vectorized "
+              f"({t_ref / t_vec:.0f}x), predictions agree on {100 * agree:.2f}%")
+
+    t_serial, serial = timed(cross_validate, columns, "class", args.folds, processes=1)
+    line = f"{args.folds}-fold cross-validation: {t_serial:.3f} s in one process"
+    if args.processes > 1:
+        t_pool, pooled = timed(cross_validate, columns, "class", args.folds, processes=args.processes)
+        assert np.array_equal(serial, pooled)
+        line += f", {t_pool:.3f} s with {args.processes} processes"
+    print(f"{line}; mean accuracy {serial.mean():.3f}")
+
+if __name__ == "__main__":
+    main()
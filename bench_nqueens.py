@@ -0,0 +1,70 @@
+"""Compare the original recursive N-Queens solver with the bitboard engine.
+
+    python bench_nqueens.py                # N = 8..16
+    python bench_nqueens.py --min 8 --max 12 --legacy-max 10
+    python bench_nqueens.py --min 14 --max 18 --legacy-max 0 --processes 16
+    python bench_nqueens.py --max 0 --find-one 1000 100000 1000000
+"""
+import argparse
+import time
+
+from nqueens import count_solutions, count_solutions_parallel, is_valid, min_conflicts, n_queen, solve
+
+
+def time_call(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+def legacy_count(n):
+    all_solutions = []
+    n_queen(0, n, [[0] * n for _ in range(n)], all_solutions)
+    return len(all_solutions)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min", type=int, default=8)
+    parser.add_argument("--max", type=int, default=16)
+    parser.add_argument("--legacy-max", type=int, default=12,
+                        help="largest N to run the original solver on (it is exponentially slower)")
+    parser.add_argument("--list-max", type=int, default=14,
+                        help="largest N to also time solve() on (it keeps every solution in memory)")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="also time count_solutions_parallel() with this many worker processes")
+    parser.add_argument("--split-depth", type=int, default=2)
+    parser.add_argument("--find-one", type=int, nargs="*", default=[], metavar="N",
+                        help="also time min_conflicts() for these board sizes")
+    args = parser.parse_args()
+
+    header = f"{'N':>3} {'solutions':>10} {'legacy s':>10} {'bitboard s':>11} {'count s':>9} {'speedup':>8}"
+    if args.processes:
+        header += f" {'parallel s':>11} {'scaling':>8}"
+    print(header)
+    for n in range(args.min, args.max + 1):
+        t_count, total = time_call(count_solutions, n)
+        if n <= args.list_max:
+            t_list, sols = time_call(solve, n)
+            assert total == len(sols)
+            listed = f"{t_list:11.3f}"
+        else:
+            listed = f"{'-':>11}"
+        if n <= args.legacy_max:
+            t_legacy, legacy_total = time_call(legacy_count, n)
+            assert legacy_total == total
+            legacy = f"{t_legacy:10.3f}"
+            speedup = f"{t_legacy / t_count:7.1f}x"
+        else:
+            legacy, speedup = f"{'-':>10}", f"{'-':>8}"
+        line = f"{n:>3} {total:>10} {legacy} {listed} {t_count:9.3f} {speedup}"
+        if args.processes:
+            t_par, par_total = time_call(count_solutions_parallel, n, args.processes, args.split_depth)
+            assert par_total == total
+            line += f" {t_par:11.3f} {t_count / t_par:7.1f}x"
+        print(line)
+
+    for n in args.find_one:
+        t_one, cols = time_call(min_conflicts, n, 0)
+        print(f"min_conflicts N={n}: {t_one:.3f}s valid={cols is not None and is_valid(cols)}")
+
+if __name__ == "__main__":
+    main()
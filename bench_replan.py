@@ -0,0 +1,87 @@
+"""Repair time of DStarLite after small edits vs searching again from scratch.
+
+Each round blocks (or clears) a few cells on or next to the current path,
+then times DStarLite's repair against a fresh DStarLite plan and the
+grid bfs() of PathfindingVisualizer on the edited map.
+
+    python bench_replan.py --size 200 --rounds 20 --edits 1 3 10
+"""
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+from dstarlite import DStarLite
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load(relpath, name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, relpath))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--obstacles", type=float, default=0.2)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--edits", type=int, nargs="+", default=[1, 3, 10])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    gui = load(os.path.join("Maze Solver", "import tkinter as tk.py"), "maze_gui")
+    size = args.size
+    start, goal = (0, 0), (size - 1, size - 1)
+
+    print(f"{'edits':>5} {'repair ms':>10} {'expanded':>9} {'fresh ms':>9} {'expanded':>9} {'bfs() ms':>9}")
+    for edits in args.edits:
+        rng = random.Random(args.seed)
+        maze = [[1 if rng.random() < args.obstacles else 0 for _ in range(size)] for _ in range(size)]
+        maze[0][0] = maze[size - 1][size - 1] = 0
+        planner = DStarLite(maze, start, goal)
+        path = planner.plan()
+
+        viz = object.__new__(gui.PathfindingVisualizer)
+        viz.wavefront_min_cells = float("inf")
+        viz.rows = viz.cols = size
+        viz.maze, viz.start, viz.goal = maze, start, goal
+
+        totals = [0.0, 0, 0.0, 0, 0.0]
+        for _ in range(args.rounds):
+            changes = []
+            for _ in range(edits):
+                if path and len(path) > 2 and rng.random() < 0.7:
+                    r, c = rng.choice(path[1:-1])
+                    wall = 1
+                else:
+                    r, c = rng.randrange(size), rng.randrange(size)
+                    wall = 0
+                maze[r][c] = wall
+                changes.append(((r, c), wall))
+
+            t_repair, path = timed(lambda: (planner.set_cells(changes), planner.plan())[1])
+            totals[0] += t_repair
+            totals[1] += planner.expanded
+            fresh = DStarLite(maze, start, goal)
+            t_fresh, fresh_path = timed(fresh.plan)
+            totals[2] += t_fresh
+            totals[3] += fresh.expanded
+            t_bfs, bfs_path = timed(viz.bfs)
+            totals[4] += t_bfs
+            assert (path is None) == (fresh_path is None) == (bfs_path is None)
+            assert path is None or len(path) == len(fresh_path) == len(bfs_path)
+
+        n = args.rounds
+        print(f"{edits:>5} {1000 * totals[0] / n:10.2f} {totals[1] // n:>9} "
+              f"{1000 * totals[2] / n:9.2f} {totals[3] // n:>9} {1000 * totals[4] / n:9.2f}")
+
+if __name__ == "__main__":
+    main()
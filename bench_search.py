@@ -0,0 +1,171 @@
+"""Sweep the graph searches over maze sizes, obstacle densities and seeds.
+
+Every (size, density, seed, algorithm) cell is warmed up, then timed over
+several repeats with perf_counter_ns. The search counters (expanded,
+pushes, stale pops, peak frontier length) and the peak traced memory
+(from one extra run under tracemalloc, kept out of the timings) are
+recorded alongside.
+
+    python bench_search.py --sizes 50 100 200 --densities 0.1 0.3 --seeds 0 1 2 \\
+        --json results.json --csv results.csv
+    python bench_search.py --json new.json --baseline results.json --tolerance 0.15
+    python bench_search.py --plot results.json       # charts from a saved run only
+"""
+import argparse
+import csv
+import json
+import platform
+import random
+import statistics
+import sys
+import tracemalloc
+
+KEY = ("size", "density", "seed", "algorithm")
+FIELDS = KEY + ("path_length", "expanded", "pushes", "stale_pops", "max_frontier", "peak_bytes",
+                "min_ns", "median_ns", "mean_ns", "repeat")
+
+
+def peak_memory(algo, start, goal):
+    """Peak bytes allocated by one search, traced separately from the timings"""
+    tracemalloc.start()
+    try:
+        algo.search(start, goal)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run(core, args):
+    rows = []
+    for size in args.sizes:
+        for density in args.densities:
+            for seed in args.seeds:
+                random.seed(seed)
+                graph = core.generate_maze(size, size, density, compact=True)
+                start, goal = (0, 0), (size - 1, size - 1)
+                for name in args.algorithms:
+                    algo = core.ALGORITHMS[name](graph)
+                    timings = core.time_search(algo, start, goal, args.repeat, args.warmup)
+                    stats = algo.stats()
+                    row = {
+                        "size": size, "density": density, "seed": seed, "algorithm": name,
+                        **{field: stats[field] for field in FIELDS if field in stats},
+                        "peak_bytes": peak_memory(algo, start, goal) if args.memory else None,
+                        "min_ns": min(timings),
+                        "median_ns": int(statistics.median(timings)),
+                        "mean_ns": int(statistics.fmean(timings)),
+                        "repeat": args.repeat,
+                    }
+                    rows.append(row)
+                    print(f"{size:>5} {density:>7.2f} {seed:>5} {name:<8} {row['expanded']:>9} "
+                          f"{row['max_frontier']:>9} {row['median_ns'] / 1e6:>11.3f}", flush=True)
+    return rows
+
+def write_json(path, rows):
+    meta = {"python": sys.version.split()[0], "platform": platform.platform()}
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": rows}, f, indent=1)
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def read_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def compare(rows, baseline, tolerance):
+    """Print median-time ratios against a baseline; returns the number of regressions"""
+    old = {tuple(row[k] for k in KEY): row for row in baseline}
+    regressions = 0
+    print(f"\n{'size':>5} {'density':>7} {'seed':>5} {'search':<8} {'base ms':>9} {'now ms':>9} {'ratio':>6}")
+    for row in rows:
+        ref = old.get(tuple(row[k] for k in KEY))
+        if ref is None:
+            continue
+        ratio = row["median_ns"] / max(ref["median_ns"], 1)
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  SLOWER"
+            regressions += 1
+        elif ratio < 1 - tolerance:
+            flag = "  faster"
+        if row["expanded"] != ref["expanded"]:
+            flag += f"  expanded {ref['expanded']} -> {row['expanded']}"
+        print(f"{row['size']:>5} {row['density']:>7.2f} {row['seed']:>5} {row['algorithm']:<8} "
+              f"{ref['median_ns'] / 1e6:>9.3f} {row['median_ns'] / 1e6:>9.3f} {ratio:>6.2f}{flag}")
+    return regressions
+
+def plot(rows, out=None):
+    """Median time and expansions against size, one line per algorithm
+    (averaged over densities and seeds)"""
+    import matplotlib
+    if out:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    for name in dict.fromkeys(row["algorithm"] for row in rows):
+        mine = [row for row in rows if row["algorithm"] == name]
+        sizes = sorted({row["size"] for row in mine})
+        times = [statistics.fmean(r["median_ns"] for r in mine if r["size"] == s) / 1e6 for s in sizes]
+        expanded = [statistics.fmean(r["expanded"] for r in mine if r["size"] == s) for s in sizes]
+        ax1.plot(sizes, times, marker="o", label=name)
+        ax2.plot(sizes, expanded, marker="o", label=name)
+    ax1.set_title("Median time (ms)")
+    ax2.set_title("Nodes expanded")
+    for ax in (ax1, ax2):
+        ax.set_xlabel("maze size")
+        ax.legend()
+    plt.tight_layout()
+    if out:
+        fig.savefig(out)
+    else:
+        plt.show()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.1, 0.3])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--algorithms", nargs="+", default=None,
+                        help="names from searchcore.ALGORITHMS (default: all)")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="skip the tracemalloc run")
+    parser.add_argument("--json", help="write results as JSON")
+    parser.add_argument("--csv", help="write results as CSV")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="relative slowdown that counts as a regression")
+    parser.add_argument("--plot", metavar="RESULTS", help="only plot a saved JSON run, then exit")
+    parser.add_argument("--plot-out", help="save the plot to this file instead of showing it")
+    args = parser.parse_args()
+
+    if args.plot:
+        plot(read_results(args.plot), args.plot_out)
+        return
+
+    import searchcore as core
+    if args.algorithms is None:
+        args.algorithms = list(core.ALGORITHMS)
+    unknown = set(args.algorithms) - set(core.ALGORITHMS)
+    if unknown:
+        parser.error(f"unknown algorithms: {', '.join(sorted(unknown))}")
+
+    print(f"{'size':>5} {'density':>7} {'seed':>5} {'search':<8} {'expanded':>9} {'frontier':>9} {'median ms':>11}")
+    rows = run(core, args)
+    if args.json:
+        write_json(args.json, rows)
+    if args.csv:
+        write_csv(args.csv, rows)
+    if args.baseline:
+        regressions = compare(rows, read_results(args.baseline), args.tolerance)
+        if regressions:
+            print(f"\n{regressions} result(s) slower than the baseline by more than {args.tolerance:.0%}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
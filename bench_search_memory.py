@@ -0,0 +1,110 @@
+"""Peak memory of the maze searches on long-corridor (serpentine) mazes.
+
+Compares the parent-pointer searches with the old style that copied the
+whole path into every frontier entry (kept below as the reference).
+
+    python bench_search_memory.py --sizes 21 41 81 161
+"""
+import argparse
+import importlib.util
+import os
+import time
+import tracemalloc
+from collections import deque
+
+import searchcore as core
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load(relpath, name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, relpath))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def serpentine_grid(size, width):
+    """0/1 grid of `width`-wide corridors joined alternately at the right and left ends"""
+    maze = [[0] * size for _ in range(size)]
+    for k, r in enumerate(range(width, size, width + 1)):
+        maze[r] = [1] * size
+        maze[r][size - 1 if k % 2 == 0 else 0] = 0
+    return maze
+
+def far_end(size, width):
+    """Last cell of the snake: the far corner of the bottom corridor"""
+    corridors = len(range(width, size, width + 1)) + 1
+    return (size - 1, size - 1 if corridors % 2 == 0 else 0)
+
+def serpentine_graph(graph_cls, size, width):
+    graph = graph_cls()
+    maze = serpentine_grid(size, width)
+    for r in range(size):
+        for c in range(size):
+            if maze[r][c]:
+                continue
+            for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < size and 0 <= nc < size and maze[nr][nc] == 0:
+                    graph.add_edge((r, c), (nr, nc))
+    return graph
+
+def path_copy_bfs(graph, start, goal):
+    """The search as it was before parent pointers: a path copy per entry"""
+    queue = deque([(start, [start])])
+    visited = set()
+    while queue:
+        node, path = queue.popleft()
+        if node == goal:
+            return path
+        if node not in visited:
+            visited.add(node)
+            for neighbor, _ in graph.edges.get(node, []):
+                queue.append((neighbor, path + [neighbor]))
+    return []
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[21, 41, 81, 161])
+    parser.add_argument("--width", type=int, default=3, help="corridor width in cells")
+    parser.add_argument("--reference-max", type=int, default=81,
+                        help="largest size to run the path-copying reference on")
+    args = parser.parse_args()
+
+    gui = load(os.path.join("Maze Solver", "import tkinter as tk.py"), "maze_gui")
+
+    print(f"{'size':>5} {'path':>7} {'search':<16} {'seconds':>9} {'peak KiB':>10}")
+    for size in args.sizes:
+        goal = far_end(size, args.width)
+        graph = serpentine_graph(core.Graph, size, args.width)
+        graph.compact()  # build outside the measured region
+
+        viz = object.__new__(gui.PathfindingVisualizer)
+        viz.rows = viz.cols = size
+        viz.maze = serpentine_grid(size, args.width)
+        viz.start, viz.goal = (0, 0), goal
+
+        runs = [
+            ("BFS", lambda: core.BFS(graph).search((0, 0), goal)),
+            ("DFS", lambda: core.DFS(graph).search((0, 0), goal)),
+            ("AStar", lambda: core.AStar(graph).search((0, 0), goal)),
+            ("grid bfs()", viz.bfs),
+            ("grid dfs()", viz.dfs),
+        ]
+        if size <= args.reference_max:
+            runs.append(("path-copy BFS", lambda: path_copy_bfs(graph, (0, 0), goal)))
+        for name, fn in runs:
+            path, elapsed, peak = measure(fn)
+            print(f"{size:>5} {len(path or []):>7} {name:<16} {elapsed:9.4f} {peak / 1024:10.1f}")
+
+if __name__ == "__main__":
+    main()
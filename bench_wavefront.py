@@ -0,0 +1,50 @@
+"""Cell-by-cell PathfindingVisualizer.bfs() vs the NumPy wavefront BFS.
+
+    python bench_wavefront.py --sizes 250 500 1000 --obstacles 0.2
+"""
+import argparse
+import importlib.util
+import os
+import time
+
+import gridsearch
+import mazegen
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load(relpath, name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, relpath))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000])
+    parser.add_argument("--obstacles", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    gui = load(os.path.join("Maze Solver", "import tkinter as tk.py"), "maze_gui")
+
+    print(f"{'size':>5} {'path':>6} {'bfs() s':>9} {'wavefront s':>12} {'speedup':>8}")
+    for size in args.sizes:
+        grid = mazegen.random_grid(size, size, args.obstacles, seed=args.seed)
+        viz = object.__new__(gui.PathfindingVisualizer)
+        viz.wavefront_min_cells = float("inf")  # force the cell-by-cell loop
+        viz.rows = viz.cols = size
+        viz.maze = grid.tolist()
+        viz.start, viz.goal = (0, 0), (size - 1, size - 1)
+
+        t = time.perf_counter()
+        expected = viz.bfs()
+        t_loop = time.perf_counter() - t
+        t = time.perf_counter()
+        path = gridsearch.wavefront_bfs(grid, viz.start, viz.goal)
+        t_wave = time.perf_counter() - t
+        assert path == expected
+        print(f"{size:>5} {len(path or []):>6} {t_loop:9.3f} {t_wave:12.3f} {t_loop / t_wave:7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Fail if importing the headless search core gets slow or pulls in GUI libraries.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter a
+few times, takes the best cumulative import time of the module and checks
+it against a budget. Any GUI or plotting package in the import tree is an
+error on its own, whatever the time.
+
+    python check_importtime.py
+    python check_importtime.py --budget-ms 50 --module searchcore --runs 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FORBIDDEN = ("matplotlib", "networkx", "tkinter", "_tkinter", "numpy", "graphplot", "searchworker")
+
+
+def import_tree(module):
+    """{imported module: cumulative microseconds} from one cold import"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=HERE, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        times[name.strip()] = int(cumulative)
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="searchcore")
+    parser.add_argument("--budget-ms", type=float, default=30.0)
+    parser.add_argument("--runs", type=int, default=3, help="best of this many cold starts")
+    args = parser.parse_args()
+
+    best, tree = None, {}
+    for _ in range(args.runs):
+        tree = import_tree(args.module)
+        us = tree[args.module]
+        best = us if best is None else min(best, us)
+
+    heaviest = sorted((us, name) for name, us in tree.items() if name != args.module)[-5:]
+    print(f"import {args.module}: {best / 1000:.1f} ms (budget {args.budget_ms:.1f} ms)")
+    for us, name in reversed(heaviest):
+        print(f"  {name:<24} {us / 1000:8.1f} ms")
+
+    failed = False
+    pulled = sorted({name.split(".")[0] for name in tree if name != args.module} & set(FORBIDDEN))
+    if pulled:
+        print(f"FAIL: {args.module} imports {', '.join(pulled)}")
+        failed = True
+    if best / 1000 > args.budget_ms:
+        print(f"FAIL: over budget by {best / 1000 - args.budget_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# --------------------------
+# INCREMENTAL REPLANNING (D* LITE)
+# --------------------------
+# A planner that keeps its search state between queries on a 0/1 wall grid
+# (1 = wall, 4-connected, unit steps). The search runs backwards from the
+# goal, so when cells change or the start moves only the part of the
+# shortest-path tree that depends on them is repaired.
+#
+#   planner = DStarLite(maze, (0, 0), (99, 99))
+#   path = planner.plan()
+#   planner.set_cells([((5, 7), 1), ((6, 7), 0)])   # wall / clear
+#   planner.move_start((1, 0))
+#   path = planner.plan()
+#
+# Koenig & Likhachev, "D* Lite" (AAAI 2002), the non-optimized variant.
+import heapq
+import math
+
+from reachability import DIRECTIONS
+
+INF = math.inf
+
+
+class DStarLite:
+    def __init__(self, maze, start, goal):
+        self.rows = len(maze)
+        self.cols = len(maze[0]) if self.rows else 0
+        self.walls = bytearray(self.rows * self.cols)
+        for r, row in enumerate(maze):
+            for c, cell in enumerate(row):
+                if cell:
+                    self.walls[r * self.cols + c] = 1
+        self.start = start
+        self.expanded = 0
+        self._reset(goal)
+
+    def _reset(self, goal):
+        """Throw away the search state and root a new search at `goal`"""
+        n = self.rows * self.cols
+        self.goal = goal
+        self.g = [INF] * n
+        self.rhs = [INF] * n
+        self.queued = [None] * n  # key each node is queued under, or None
+        self.open = []
+        self.km = 0
+        self.last_start = self.start
+        s = self._id(goal)
+        self.rhs[s] = 0
+        self._push(s)
+
+    # -- grid helpers -------------------------------------------------------
+    def _id(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def _neighbors(self, s):
+        r, c = divmod(s, self.cols)
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                yield nr * self.cols + nc
+
+    def _heuristic(self, s):
+        r, c = divmod(s, self.cols)
+        return abs(r - self.start[0]) + abs(c - self.start[1])
+
+    def _cost(self, u, v):
+        return INF if self.walls[u] or self.walls[v] else 1
+
+    # -- D* Lite core -------------------------------------------------------
+    def _key(self, s):
+        m = min(self.g[s], self.rhs[s])
+        return (m + self._heuristic(s) + self.km, m)
+
+    def _push(self, s):
+        key = self._key(s)
+        self.queued[s] = key
+        heapq.heappush(self.open, (key, s))
+
+    def _update_vertex(self, u):
+        if u != self._id(self.goal):
+            best = INF
+            for v in self._neighbors(u):
+                cost = self._cost(u, v) + self.g[v]
+                if cost < best:
+                    best = cost
+            self.rhs[u] = best
+        if self.g[u] != self.rhs[u]:
+            self._push(u)
+        else:
+            self.queued[u] = None  # left in the heap, skipped when popped
+
+    def _top(self):
+        """Smallest valid (key, node) in the queue, dropping stale entries"""
+        while self.open:
+            key, s = self.open[0]
+            if self.queued[s] == key:
+                return key, s
+            heapq.heappop(self.open)
+        return (INF, INF), None
+
+    def _compute_shortest_path(self):
+        s_start = self._id(self.start)
+        while True:
+            k_old, u = self._top()
+            if u is None:
+                break
+            if k_old >= self._key(s_start) and self.rhs[s_start] == self.g[s_start]:
+                break
+            heapq.heappop(self.open)
+            self.queued[u] = None
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u)
+            elif self.g[u] > self.rhs[u]:
+                self.g[u] = self.rhs[u]
+                self.expanded += 1
+                for p in self._neighbors(u):
+                    self._update_vertex(p)
+            else:
+                self.g[u] = INF
+                self.expanded += 1
+                self._update_vertex(u)
+                for p in self._neighbors(u):
+                    self._update_vertex(p)
+
+    # -- public API ---------------------------------------------------------
+    def plan(self):
+        """Repair the search and return the path from start to goal, or None"""
+        self.expanded = 0
+        self._note_start_move()
+        self._compute_shortest_path()
+        s = self._id(self.start)
+        if self.g[s] == INF or self.walls[s]:
+            return None
+        goal = self._id(self.goal)
+        path = [self.start]
+        while s != goal:
+            s = min(self._neighbors(s), key=lambda v: self._cost(s, v) + self.g[v])
+            path.append(divmod(s, self.cols))
+        return path
+
+    def set_cells(self, changes):
+        """Apply ((r, c), wall) changes; the next plan() repairs around them"""
+        touched = set()
+        for (r, c), wall in changes:
+            s = r * self.cols + c
+            if self.walls[s] != bool(wall):
+                self.walls[s] = 1 if wall else 0
+                touched.add(s)
+                touched.update(self._neighbors(s))
+        if touched:
+            self._note_start_move()
+            for s in touched:
+                self._update_vertex(s)
+
+    def toggle(self, cell):
+        r, c = cell
+        self.set_cells([(cell, not self.walls[r * self.cols + c])])
+
+    def move_start(self, start):
+        """Move the start; keys are adjusted lazily through km"""
+        self.start = start
+
+    def move_goal(self, goal):
+        """The search is rooted at the goal, so moving it starts a fresh search"""
+        if goal != self.goal:
+            self._reset(goal)
+
+    def _note_start_move(self):
+        # Keys already in the queue were computed against last_start; km
+        # keeps them valid lower bounds after the start moves.
+        if self.start != self.last_start:
+            self.km += abs(self.start[0] - self.last_start[0]) + abs(self.start[1] - self.last_start[1])
+            self.last_start = self.start
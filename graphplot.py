@@ -0,0 +1,93 @@
+# --------------------------
+# CACHED MATPLOTLIB RENDERING OF GRAPHS
+# --------------------------
+# GraphPlot builds the artists for one graph once: a LineCollection for all
+# edges, one scatter for all nodes and, for graphs built from a 0/1 wall
+# grid (.grid), an imshow of the grid instead. Showing a path afterwards
+# only moves the data of one line and one scatter.
+#
+#   plot = GraphPlot(ax, graph)
+#   plot.show_path(path)
+#   fig.canvas.draw_idle()
+import numpy as np
+from matplotlib.collections import LineCollection
+
+
+class GraphPlot:
+    # Node labels are drawn up to this many nodes, node markers up to marker_max_nodes
+    label_max_nodes = 200
+    marker_max_nodes = 5000
+
+    def __init__(self, ax, graph, node_size=300, title=None):
+        self.ax = ax
+        self.graph = graph
+        self.csr = graph.compact()
+        csr = self.csr
+        n = csr.num_nodes
+        self.xy = node_positions(graph)
+
+        ax.clear()
+        ax.set_axis_off()
+        grid = getattr(graph, "grid", None)
+        if grid is not None:
+            rows, cols = grid.shape
+            ax.imshow(grid, cmap="gray_r", interpolation="nearest",
+                      extent=(-0.5, cols - 0.5, -(rows - 0.5), 0.5))
+        else:
+            offsets = np.asarray(csr.offsets, dtype=np.int64)
+            tails = np.repeat(np.arange(n), np.diff(offsets))
+            heads = np.asarray(csr.targets, dtype=np.int64)
+            segments = np.stack([self.xy[tails], self.xy[heads]], axis=1)
+            ax.add_collection(LineCollection(segments, colors="black", linewidths=1, zorder=1))
+            if n <= self.marker_max_nodes:
+                size = node_size if n <= self.label_max_nodes else node_size * self.label_max_nodes / n
+                ax.scatter(self.xy[:, 0], self.xy[:, 1], s=size, c="lightblue", zorder=2)
+            if n <= self.label_max_nodes:
+                for i in range(n):
+                    ax.annotate(str(csr.node_of(i)), self.xy[i], ha="center", va="center",
+                                fontsize=7, zorder=3)
+            ax.autoscale_view()
+        self.node_size = node_size if n <= self.label_max_nodes else max(4, node_size * self.label_max_nodes / n)
+        self.path_line, = ax.plot([], [], color="red", linewidth=2, zorder=4)
+        self.path_nodes = ax.scatter([], [], s=self.node_size, c="red", zorder=5)
+        if title:
+            ax.set_title(title)
+
+    def current(self, graph):
+        """True while this plot still matches graph (same object, no new edges)"""
+        return graph is self.graph and graph.compact() is self.csr
+
+    def show_path(self, path, title=None):
+        """Replace the highlighted path (None or [] clears it)"""
+        if path:
+            ids = [self.csr.id_of(node) for node in path]
+            xy = self.xy[ids]
+        else:
+            xy = np.empty((0, 2))
+        self.path_line.set_data(xy[:, 0], xy[:, 1])
+        self.path_nodes.set_offsets(xy)
+        if title is not None:
+            self.ax.set_title(title)
+
+
+def node_positions(graph):
+    """(num_nodes, 2) float array of positions in node-id order.
+
+    Grid graphs place cell (r, c) at (c, -r); other graphs use graph.pos,
+    or a networkx spring layout when they have none.
+    """
+    csr = graph.compact()
+    if csr.shape is not None:
+        rows, cols = csr.shape
+        r, c = np.divmod(np.arange(rows * cols), cols)
+        return np.column_stack([c, -r]).astype(float)
+    pos = graph.pos
+    if not pos:
+        import networkx as nx
+        G = nx.Graph()
+        G.add_nodes_from(csr.node_list)
+        for i in range(csr.num_nodes):
+            for j in csr.targets[csr.offsets[i]:csr.offsets[i + 1]]:
+                G.add_edge(csr.node_of(i), csr.node_of(j))
+        pos = nx.spring_layout(G, seed=0)
+    return np.array([pos[node] for node in csr.node_list], dtype=float)
@@ -0,0 +1,86 @@
+# --------------------------
+# GRID-NATIVE SEARCH (NUMPY)
+# --------------------------
+# Searches that work on a 0/1 wall grid (1 = wall, as in
+# PathfindingVisualizer.maze) as a whole instead of one cell at a time.
+# Cells are addressed by flat id r * cols + c; moving to a neighbour is an
+# array shift of the ids by +1, -1, +cols or -cols.
+import numpy as np
+
+from reachability import DIRECTIONS
+
+
+def as_grid(maze):
+    """0/1 uint8 array from a list-of-lists maze (arrays pass through)"""
+    return np.asarray(maze, dtype=np.uint8)
+
+def distance_field(grid, start, goal=None):
+    """BFS layer by layer over the whole frontier at once.
+
+    Returns (dist, rank) as int32 arrays of the grid's shape: dist is the
+    number of steps from start (-1 where unreached) and rank the order in
+    which a cell-by-cell BFS would have dequeued it. With a goal the
+    expansion stops after the goal's layer.
+    """
+    grid = as_grid(grid)
+    rows, cols = grid.shape
+    n = rows * cols
+    open_flat = (grid == 0).ravel()
+    dist = np.full(n, -1, dtype=np.int32)
+    rank = np.full(n, -1, dtype=np.int32)
+    deltas = np.array([dr * cols + dc for dr, dc in DIRECTIONS], dtype=np.int64)
+    goal_id = None if goal is None else goal[0] * cols + goal[1]
+
+    s = start[0] * cols + start[1]
+    dist[s] = rank[s] = 0
+    frontier = np.array([s], dtype=np.int64)
+    layer, ranked = 0, 1
+    while frontier.size and (goal_id is None or dist[goal_id] == -1):
+        layer += 1
+        col = frontier % cols
+        inside = np.empty((frontier.size, len(DIRECTIONS)), dtype=bool)
+        inside[:, 0] = col < cols - 1
+        inside[:, 1] = col > 0
+        inside[:, 2] = frontier < n - cols
+        inside[:, 3] = frontier >= cols
+        # Row-major over (frontier cell, direction) is exactly the order a
+        # FIFO queue would discover them in.
+        cand = (frontier[:, None] + deltas)[inside]
+        cand = cand[open_flat[cand] & (dist[cand] == -1)]
+        if not cand.size:
+            break
+        _, first = np.unique(cand, return_index=True)
+        first.sort()
+        frontier = cand[first]
+        dist[frontier] = layer
+        rank[frontier] = np.arange(ranked, ranked + frontier.size, dtype=np.int32)
+        ranked += frontier.size
+    return dist.reshape(rows, cols), rank.reshape(rows, cols)
+
+def trace_down(dist, rank, goal):
+    """Walk from the goal down the distance field to the start.
+
+    Among the neighbours one step closer, the one with the lowest rank is
+    the one BFS reached first, i.e. the BFS parent.
+    """
+    rows, cols = dist.shape
+    r, c = goal
+    if dist[r, c] < 0:
+        return None
+    path = [(r, c)]
+    for d in range(int(dist[r, c]) - 1, -1, -1):
+        best = None
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and dist[nr, nc] == d:
+                if best is None or rank[nr, nc] < rank[best]:
+                    best = (nr, nc)
+        r, c = best
+        path.append(best)
+    path.reverse()
+    return path
+
+def wavefront_bfs(maze, start, goal):
+    """Drop-in for PathfindingVisualizer.bfs(): path list, or None"""
+    dist, rank = distance_field(maze, start, goal)
+    return trace_down(dist, rank, goal)
@@ -0,0 +1,126 @@
+# --------------------------
+# RETAINED-MODE GRID RENDERING (TKINTER)
+# --------------------------
+# Draws a rows x cols grid on a Tk canvas once and afterwards only touches
+# what changed: cells whose color differs from the last paint are recolored,
+# start/goal markers are moved, and each named path is a single polyline
+# whose coordinates are replaced.
+#
+#   view = GridView(canvas, rows, cols)
+#   view.paint(maze)                      # 1 = wall, 0 = open
+#   view.set_marker("start", (0, 0), "green")
+#   view.draw_path("BFS", path, "blue", offset=-3)
+#
+# Small grids get one rectangle item per cell (kept in `items`). Grids of
+# raster_min_cells or more are a single PhotoImage instead, recolored in
+# place, since thousands of canvas items make Tk slow to redraw.
+import tkinter as tk
+
+WALL, OPEN = "#000000", "#ffffff"
+
+
+class GridView:
+    raster_min_cells = 10000
+
+    def __init__(self, canvas, rows, cols, size=500):
+        self.canvas = canvas
+        self.rows, self.cols = rows, cols
+        self.cell_size = max(1, size // max(rows, cols, 1))
+        self.colors = [None] * (rows * cols)  # color currently shown per cell
+        self.items = None
+        self.image = None
+        self.paths = {}
+        self.markers = {}
+        canvas.delete("all")
+        if rows * cols >= self.raster_min_cells:
+            self.image = tk.PhotoImage(width=cols * self.cell_size, height=rows * self.cell_size)
+            canvas.create_image(0, 0, image=self.image, anchor=tk.NW)
+        else:
+            s = self.cell_size
+            self.items = [[canvas.create_rectangle(c * s, r * s, c * s + s, r * s + s, fill=OPEN)
+                           for c in range(cols)] for r in range(rows)]
+
+    def cell_at(self, x, y):
+        """Grid cell under canvas point (x, y), or None outside the grid"""
+        r, c = y // self.cell_size, x // self.cell_size
+        return (r, c) if 0 <= r < self.rows and 0 <= c < self.cols else None
+
+    def center(self, cell):
+        r, c = cell
+        half = self.cell_size // 2
+        return c * self.cell_size + half, r * self.cell_size + half
+
+    # -- cells --------------------------------------------------------------
+    def set_cells(self, changes):
+        """Recolor ((r, c), color) pairs; cells already that color are skipped"""
+        s, cols, colors = self.cell_size, self.cols, self.colors
+        for (r, c), color in changes:
+            i = r * cols + c
+            if colors[i] == color:
+                continue
+            colors[i] = color
+            if self.items is not None:
+                self.canvas.itemconfig(self.items[r][c], fill=color)
+            else:
+                self.image.put(color, to=(c * s, r * s, c * s + s, r * s + s))
+
+    def paint(self, maze):
+        """Show a whole 0/1 wall grid.
+
+        Cell items are only recolored where the color changed; a raster is
+        rewritten with one put(), which beats a put() per changed cell when
+        a new maze changes a large share of them.
+        """
+        if self.image is not None:
+            self._paint_raster(maze)
+            return
+        self.set_cells(((r, c), WALL if cell else OPEN)
+                       for r, row in enumerate(maze) for c, cell in enumerate(row))
+
+    def _paint_raster(self, maze):
+        s = self.cell_size
+        lines = []
+        for r, row in enumerate(maze):
+            colors = [WALL if cell else OPEN for cell in row]
+            self.colors[r * self.cols:(r + 1) * self.cols] = colors
+            line = "{" + " ".join(color for color in colors for _ in range(s)) + "}"
+            lines.extend([line] * s)
+        self.image.put(" ".join(lines), to=(0, 0))
+
+    # -- overlays -----------------------------------------------------------
+    def set_marker(self, name, cell, color, inset=5):
+        """Place the oval `name` on a cell, creating it the first time"""
+        r, c = cell
+        s = self.cell_size
+        inset = min(inset, s // 4)
+        coords = (c * s + inset, r * s + inset, c * s + s - inset, r * s + s - inset)
+        item = self.markers.get(name)
+        if item is None:
+            self.markers[name] = self.canvas.create_oval(*coords, fill=color)
+        else:
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfig(item, fill=color)
+        self.canvas.tag_raise(self.markers[name])
+
+    def draw_path(self, name, path, color, offset=0, width=3):
+        """Show `path` as the single polyline `name` (hidden if the path is empty)"""
+        item = self.paths.get(name)
+        if not path or len(path) < 2:
+            if item is not None:
+                self.canvas.itemconfig(item, state=tk.HIDDEN)
+            return
+        coords = []
+        for cell in path:
+            x, y = self.center(cell)
+            coords += (x + offset, y + offset)
+        if item is None:
+            item = self.paths[name] = self.canvas.create_line(*coords, fill=color, width=width)
+        else:
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfig(item, fill=color, state=tk.NORMAL)
+        for marker in self.markers.values():
+            self.canvas.tag_raise(marker)
+
+    def clear_paths(self):
+        for item in self.paths.values():
+            self.canvas.itemconfig(item, state=tk.HIDDEN)
@@ -0,0 +1,423 @@
+# --------------------------
+# HIERARCHICAL A* (HPA*)
+# --------------------------
+# The map is cut into cluster_size x cluster_size clusters. Where a run of
+# crossing edges joins two clusters, its middle (or, for a run of
+# wide_entrance or more, its two ends) becomes a transition, and the
+# cells on either side of it are entrances. Distances between the
+# entrances of a cluster, found by searches that stay inside it, make up
+# an abstract graph. A query links start and goal to the entrances of
+# their clusters, runs A* over the abstract graph and refines each
+# abstract step back into cells with one more search inside a cluster.
+# The work grows with the number of clusters crossed rather than cells,
+# at the price of paths that can be slightly longer than A*'s (error()
+# measures by how much).
+#
+#   planner = HPAStar(generate_grid_maze(1000, 1000, seed=1), cluster_size=16)
+#   path = planner.search((0, 0), (999, 999))
+#   planner.graph = grid_graph(edited)          # after changing some cells
+#   planner.invalidate(changed_cells)           # rebuilt on the next search
+#
+# Nodes must be (r, c) cells and edges should run both ways, as in
+# grid_graph() and generate_grid_maze(); on one-way graphs such as
+# generate_maze() a path that needs a crossing that was not kept as a
+# transition is missed. For grid-shaped graphs (compact().shape) only the
+# clusters around invalidated cells are rebuilt; other graphs are rebuilt
+# whole when they change.
+#
+# Botea, Mueller & Schaeffer, "Near Optimal Hierarchical Path-Finding" (2004).
+import heapq
+import itertools
+import math
+import os
+import time
+from array import array
+from collections import deque
+from multiprocessing import Pool
+
+from searchcore import HEURISTICS, AStar, SearchAlgorithm
+
+INF = math.inf
+
+
+def _local_search(state, cluster, source, wanted=None, parents=False):
+    """Search from source without leaving its cluster.
+
+    state is (offsets, targets, costs, label, unit). Stops once every id in
+    wanted is settled. Returns (dist, parent, expanded) with dist and
+    parent as dicts over node ids (parent is None unless asked for).
+    """
+    offsets, targets, costs, label, unit = state
+    dist = {source: 0}
+    parent = {source: -1} if parents else None
+    left = None if wanted is None else set(wanted) - {source}
+    expanded = 0
+    if unit:
+        queue = deque([source])
+        while queue and (left is None or left):
+            node = queue.popleft()
+            expanded += 1
+            d = dist[node] + 1
+            for t in targets[offsets[node]:offsets[node + 1]]:
+                if t not in dist and label[t] == cluster:
+                    dist[t] = d
+                    if parents:
+                        parent[t] = node
+                    if left is not None:
+                        left.discard(t)
+                    queue.append(t)
+        return dist, parent, expanded
+
+    done = set()
+    heap = [(0, source)]
+    while heap and (left is None or left):
+        d, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        expanded += 1
+        if left is not None:
+            left.discard(node)
+        for k in range(offsets[node], offsets[node + 1]):
+            t = targets[k]
+            if t in done or label[t] != cluster:
+                continue
+            nd = d + costs[k]
+            if nd < dist.get(t, INF):
+                dist[t] = nd
+                if parents:
+                    parent[t] = node
+                heapq.heappush(heap, (nd, t))
+    return dist, parent, expanded
+
+def _search_back(state, cluster, members, goal, wanted):
+    """Distances to goal from wanted nodes of its cluster, searching the
+    reversed edges inside the cluster. Returns (dist, next hop, expanded)."""
+    offsets, targets, costs, label, _ = state
+    preds = {}
+    for u in members:
+        for k in range(offsets[u], offsets[u + 1]):
+            if label[targets[k]] == cluster:
+                preds.setdefault(targets[k], []).append((u, costs[k]))
+    dist = {goal: 0}
+    hop = {goal: -1}
+    done = set()
+    left = set(wanted) - {goal}
+    heap = [(0, goal)]
+    expanded = 0
+    while heap and left:
+        d, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        expanded += 1
+        left.discard(node)
+        for u, cost in preds.get(node, ()):
+            nd = d + cost
+            if u not in done and nd < dist.get(u, INF):
+                dist[u] = nd
+                hop[u] = node
+                heapq.heappush(heap, (nd, u))
+    return dist, hop, expanded
+
+def _walk(parent, a, b):
+    """Nodes after a up to b, following parent pointers back from b"""
+    segment = []
+    while b != a:
+        segment.append(b)
+        b = parent[b]
+    segment.reverse()
+    return tuple(segment)
+
+def _entrance_distances(state, cluster, entrances):
+    """{entrance: [(other entrance, distance), ...]} inside one cluster"""
+    table = {}
+    for e in entrances:
+        dist = _local_search(state, cluster, e, entrances)[0]
+        table[e] = [(f, dist[f]) for f in entrances if f != e and f in dist]
+    return table
+
+_worker_state = None
+
+def _init_worker(state):
+    global _worker_state
+    _worker_state = state
+
+def _cluster_task(task):
+    cluster, entrances = task
+    return cluster, _entrance_distances(_worker_state, cluster, entrances)
+
+
+class HPAStar(SearchAlgorithm):
+    """HPA* over a graph of (r, c) cells (see the notes at the top).
+
+    processes is the number of worker processes for the cluster tables
+    (None = one per CPU, 1 = build in this process); a pool is only
+    started when at least parallel_min_clusters tables need building.
+    After a search, `cost` is the path cost and `rebuilt` the number of
+    cluster tables the search had to (re)build first.
+    """
+    parallel_min_clusters = 64
+
+    def __init__(self, graph, cluster_size=16, heuristic="manhattan", wide_entrance=6, processes=None):
+        super().__init__(graph)
+        self.cluster_size = cluster_size
+        self.heuristic_fn = HEURISTICS[heuristic] if isinstance(heuristic, str) else heuristic
+        self.wide_entrance = wide_entrance
+        self.processes = processes
+        self.cost = INF
+        self.rebuilt = 0
+        self._csr = None
+        self._dirty = set()
+
+    def invalidate(self, cells):
+        """Mark the clusters holding these cells for a rebuild before the next search"""
+        if self._csr is None:
+            return  # nothing built yet
+        size = self.cluster_size
+        for r, c in cells:
+            self._dirty.add(r // size * self._ncc + c // size)
+
+    def build(self):
+        """Bring the cluster tables up to date now; returns the seconds taken"""
+        t = time.perf_counter()
+        self._refresh(self.graph.compact())
+        return time.perf_counter() - t
+
+    def error(self, start, goal):
+        """How much longer this planner's path is than exact A*'s, as a
+        fraction (0.0 = optimal), or None if there is no path"""
+        self.search(start, goal)
+        exact = AStar(self.graph, self.heuristic_fn)
+        exact.search(start, goal)
+        if not exact.path:
+            return None
+        return self.cost / exact.cost - 1 if exact.cost else 0.0
+
+    def search(self, start, goal):
+        start_time = time.time()
+        csr, s, g = self._prepare(start, goal)
+        if start == goal:
+            self.cost = 0
+            return self._finish([start], start_time)
+        if s is None or g is None:
+            self.cost = INF
+            return self._finish([], start_time)
+        self._refresh(csr)
+        self._mark("build")
+        state, label, tables, inter_out = self._state, self._label, self.tables, self.inter_out
+        on_expand, on_push = self._hooks()
+        ks, kg = label[s], label[g]
+
+        # Link start and goal to the entrances of their clusters
+        wanted = self.entrances[ks] + ([g] if ks == kg else [])
+        dist, from_start, expanded = _local_search(state, ks, s, wanted, parents=True)
+        self.expanded += expanded
+        start_edges = [(e, dist[e]) for e in wanted if e != s and e in dist]
+        dist, to_goal, expanded = _search_back(state, kg, self._members_of(kg), g, self.entrances[kg])
+        self.expanded += expanded
+        goal_edges = {e: ((g, dist[e]),) for e in self.entrances[kg] if e != g and e in dist}
+
+        # A* over the abstract graph, ties broken as in AStar
+        h, node_of, visited = self.heuristic_fn, csr.node_of, self.visited
+        g_score = {s: 0}
+        parent = {s: -1}
+        counter = itertools.count()
+        h_start = h(start, goal)
+        open_set = [(h_start, h_start, next(counter), s)]
+        self.pushes = 1
+        while open_set:
+            if len(open_set) > self.max_frontier:
+                self.max_frontier = len(open_set)
+            _, _, _, node = heapq.heappop(open_set)
+            if visited[node]:
+                self.stale_pops += 1
+                continue
+            visited[node] = 1
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(node_of(node))
+            if node == g:
+                break
+            g_node = g_score[node]
+            edges = itertools.chain(tables[label[node]].get(node, ()), inter_out.get(node, ()),
+                                    start_edges if node == s else (), goal_edges.get(node, ()))
+            for neighbor, cost in edges:
+                if visited[neighbor]:
+                    continue
+                tentative = g_node + cost
+                if tentative < g_score.get(neighbor, INF):
+                    g_score[neighbor] = tentative
+                    parent[neighbor] = node
+                    h_neighbor = h(node_of(neighbor), goal)
+                    heapq.heappush(open_set, (tentative + h_neighbor, h_neighbor, next(counter), neighbor))
+                    self.pushes += 1
+                    if on_push is not None:
+                        on_push(node_of(neighbor))
+        else:
+            self.cost = INF
+            return self._finish([], start_time)
+        self.cost = g_score[g]
+        self._mark("search")
+
+        # Refine: transitions are single edges, other steps stay in one
+        # cluster; steps between two entrances are cached with the tables
+        steps = [g]
+        while parent[steps[-1]] != -1:
+            steps.append(parent[steps[-1]])
+        steps.reverse()
+        ids = [s]
+        for a, b in zip(steps, steps[1:]):
+            k = label[a]
+            if label[b] != k:
+                ids.append(b)
+            elif a == s:
+                ids.extend(_walk(from_start, a, b))
+            elif b == g:
+                while a != g:
+                    a = to_goal[a]
+                    ids.append(a)
+            else:
+                segments = self.segments[k]
+                segment = segments.get((a, b))
+                if segment is None:
+                    _, par, expanded = _local_search(state, k, a, (b,), parents=True)
+                    self.expanded += expanded
+                    segment = segments[a, b] = _walk(par, a, b)
+                ids.extend(segment)
+        return self._finish([node_of(i) for i in ids], start_time)
+
+    # -- abstract graph -----------------------------------------------------
+    def _refresh(self, csr):
+        """Rebuild what changed since the last search, if anything"""
+        self.rebuilt = 0
+        old = self._csr
+        if old is None or (csr is not old and (csr.shape is None or csr.shape != old.shape or not self._dirty)):
+            self._build(csr, None)
+        elif csr is not old or self._dirty:
+            self._build(csr, self._dirty)
+        self._dirty = set()
+
+    def _layout(self, csr):
+        """Cluster label of every node id, for a full build"""
+        size = self.cluster_size
+        n = csr.num_nodes
+        if csr.shape is not None:
+            rows, cols = csr.shape
+        else:
+            cells = [csr.node_of(i) for i in range(n)]
+            rows = 1 + max((r for r, _ in cells), default=0)
+            cols = 1 + max((c for _, c in cells), default=0)
+        self._ncc = -(-cols // size) or 1
+        self._ncr = -(-rows // size) or 1
+        if csr.shape is not None:
+            row_labels = [c // size for c in range(cols)]
+            label = array("l")
+            for r in range(rows):
+                base = r // size * self._ncc
+                label.extend([base + x for x in row_labels])
+            self._members = None
+        else:
+            label = array("l", [r // size * self._ncc + c // size for r, c in cells])
+            self._members = {}
+            for i, k in enumerate(label):
+                self._members.setdefault(k, []).append(i)
+        self._label = label
+        self.crossings = {}
+        self.entrances = {}
+        self.tables = {}
+        self.segments = {}
+
+    def _members_of(self, k):
+        if self._members is not None:
+            return self._members.get(k, ())
+        rows, cols = self._csr.shape
+        size = self.cluster_size
+        kr, kc = divmod(k, self._ncc)
+        c0, c1 = kc * size, min(kc * size + size, cols)
+        return (r * cols + c for r in range(kr * size, min(kr * size + size, rows)) for c in range(c0, c1))
+
+    def _adjacent(self, k):
+        kr, kc = divmod(k, self._ncc)
+        for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            nr, nc = kr + dr, kc + dc
+            if 0 <= nr < self._ncr and 0 <= nc < self._ncc:
+                yield nr * self._ncc + nc
+
+    def _build(self, csr, dirty):
+        """Recompute transitions, entrances and tables; dirty=None rebuilds all"""
+        if dirty is None:
+            self._layout(csr)
+            scan = set(range(self._ncr * self._ncc))
+        else:
+            scan = set(dirty)
+            for k in dirty:
+                scan.update(self._adjacent(k))
+            for key in [key for key in self.crossings if key[0] in dirty or key[1] in dirty]:
+                del self.crossings[key]
+        self._csr = csr
+        offsets, targets, costs, label = csr.offsets, csr.targets, csr.costs, self._label
+        self._state = (offsets, targets, costs, label, csr.unit_costs())
+
+        found = {}
+        for k in scan:
+            for u in self._members_of(k):
+                for j in range(offsets[u], offsets[u + 1]):
+                    kv = label[targets[j]]
+                    if kv != k and (dirty is None or k in dirty or kv in dirty):
+                        found.setdefault((k, kv), []).append((u, targets[j], costs[j]))
+        for key, edges in found.items():
+            self.crossings[key] = self._transitions(csr, key, edges)
+
+        entrances = {k: set() for k in scan}
+        self.inter_out = {}
+        for (a, b), edges in self.crossings.items():
+            for u, v, cost in edges:
+                self.inter_out.setdefault(u, []).append((v, cost))
+                if a in entrances:
+                    entrances[a].add(u)
+                if b in entrances:
+                    entrances[b].add(v)
+        tasks = []
+        for k, ents in entrances.items():
+            ents = sorted(ents)
+            # a neighbour whose entrances did not move keeps its table
+            if dirty is None or k in dirty or ents != self.entrances.get(k, []):
+                self.entrances[k] = ents
+                tasks.append((k, ents))
+        self._tables(tasks)
+        self.rebuilt += len(tasks)
+
+    def _transitions(self, csr, key, edges):
+        """The crossing edges of one border that are kept as transitions"""
+        a, b = key
+        axis = 1 if a // self._ncc != b // self._ncc else 0  # position along the border
+        edges.sort(key=lambda edge: csr.node_of(edge[0])[axis])
+        runs = []
+        last = None
+        for edge in edges:
+            pos = csr.node_of(edge[0])[axis]
+            if last is None or pos != last + 1:
+                runs.append([])
+            runs[-1].append(edge)
+            last = pos
+        kept = []
+        for run in runs:
+            if len(run) >= self.wide_entrance:
+                kept += [run[0], run[-1]]
+            else:
+                kept.append(run[len(run) // 2])
+        return kept
+
+    def _tables(self, tasks):
+        processes = self.processes or os.cpu_count() or 1
+        if processes > 1 and len(tasks) >= self.parallel_min_clusters:
+            with Pool(processes, initializer=_init_worker, initargs=(self._state,)) as pool:
+                chunksize = max(1, len(tasks) // (4 * processes))
+                for k, table in pool.imap_unordered(_cluster_task, tasks, chunksize=chunksize):
+                    self.tables[k] = table
+        else:
+            for k, ents in tasks:
+                self.tables[k] = _entrance_distances(self._state, k, ents)
+        for k, _ in tasks:
+            self.segments[k] = {}
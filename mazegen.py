@@ -0,0 +1,170 @@
+# --------------------------
+# NUMPY MAZE GENERATION
+# --------------------------
+# Grids use the PathfindingVisualizer convention: a 2-D uint8 array with
+# 1 = wall and 0 = open. Every generator takes a seed (or a numpy Generator)
+# so benchmark maps can be reproduced exactly.
+#
+#   grid = random_grid(5000, 5000, 0.3, seed=1)
+#   offsets, targets = grid_csr(grid)     # 4-neighbour adjacency, in bulk
+from array import array
+
+import numpy as np
+
+from reachability import DIRECTIONS
+
+
+def _rng(seed):
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+def _clear(grid, cells):
+    for r, c in cells:
+        if 0 <= r < grid.shape[0] and 0 <= c < grid.shape[1]:
+            grid[r, c] = 0
+    return grid
+
+def random_grid(rows, cols, obstacle_prob=0.3, seed=None, keep_open=None):
+    """Independent walls with probability obstacle_prob.
+
+    keep_open lists cells forced open; by default the two corners (0, 0)
+    and (rows - 1, cols - 1) used as start and goal.
+    """
+    rng = _rng(seed)
+    grid = (rng.random((rows, cols)) < obstacle_prob).astype(np.uint8)
+    if keep_open is None:
+        keep_open = [(0, 0), (rows - 1, cols - 1)]
+    return _clear(grid, keep_open)
+
+def _cell_lattice(rows, cols):
+    """Cells sit on even coordinates, the odd ones between them are walls"""
+    return (rows + 1) // 2, (cols + 1) // 2
+
+def recursive_backtracker(rows, cols, seed=None):
+    """Perfect maze (one route between any two cells) by randomized DFS.
+
+    Iterative, with the stack and visited flags in flat arrays. Odd sizes
+    keep the far corner (rows - 1, cols - 1) on the cell lattice.
+    """
+    rng = _rng(seed)
+    h, w = _cell_lattice(rows, cols)
+    grid = np.ones((rows, cols), dtype=np.uint8)
+    if h == 0 or w == 0:
+        return grid
+    n = h * w
+    visited = bytearray(n)
+    stack = np.empty(n, dtype=np.int64)
+    carved = np.zeros(rows * cols, dtype=bool)
+    # One bulk draw of random numbers, refilled when used up
+    rand = rng.random(n)
+    used = 0
+
+    stack[0] = 0
+    depth = 1
+    visited[0] = 1
+    carved[0] = True
+    while depth:
+        cell = int(stack[depth - 1])
+        r, c = divmod(cell, w)
+        options = []
+        if c + 1 < w and not visited[cell + 1]:
+            options.append(cell + 1)
+        if c > 0 and not visited[cell - 1]:
+            options.append(cell - 1)
+        if r + 1 < h and not visited[cell + w]:
+            options.append(cell + w)
+        if r > 0 and not visited[cell - w]:
+            options.append(cell - w)
+        if not options:
+            depth -= 1
+            continue
+        if used == len(rand):
+            rand, used = rng.random(n), 0
+        nxt = options[int(rand[used] * len(options))]
+        used += 1
+        visited[nxt] = 1
+        nr, nc = divmod(nxt, w)
+        carved[(r + nr) * cols + (c + nc)] = True  # the wall in between
+        carved[2 * nr * cols + 2 * nc] = True
+        stack[depth] = nxt
+        depth += 1
+    grid[carved.reshape(rows, cols)] = 0
+    return grid
+
+def kruskal(rows, cols, seed=None):
+    """Perfect maze by randomized Kruskal over the lattice walls.
+
+    All candidate walls are listed and shuffled in bulk; a union-find in a
+    flat parent array then marks each wall that joins two separate regions,
+    and the marked walls are opened in one vectorized step.
+    """
+    rng = _rng(seed)
+    h, w = _cell_lattice(rows, cols)
+    grid = np.ones((rows, cols), dtype=np.uint8)
+    if h == 0 or w == 0:
+        return grid
+    grid[0::2, 0::2] = 0
+
+    ids = np.arange(h * w).reshape(h, w)
+    a = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    b = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    order = rng.permutation(len(a))
+    a, b = a[order], b[order]
+
+    parent = list(range(h * w))
+    keep = bytearray(len(a))
+    for k, (u, v) in enumerate(zip(a.tolist(), b.tolist())):
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        if u != v:
+            parent[v] = u
+            keep[k] = 1
+    keep = np.frombuffer(keep, dtype=np.uint8).astype(bool)
+    ar, ac = np.divmod(a[keep], w)
+    br, bc = np.divmod(b[keep], w)
+    grid[ar + br, ac + bc] = 0  # lattice cells are 2 apart, the wall is the midpoint
+    return grid
+
+def as_array(values, typecode="l"):
+    """Copy a numpy vector into a stdlib array (fast to index from Python loops)"""
+    out = array(typecode)
+    out.frombytes(np.ascontiguousarray(values, dtype=np.dtype(typecode)).tobytes())
+    return out
+
+GENERATORS = {"random": random_grid, "backtracker": recursive_backtracker, "kruskal": kruskal}
+
+def generate(rows, cols, algorithm="random", seed=None, **kwargs):
+    """Dispatch to one of GENERATORS by name"""
+    return GENERATORS[algorithm](rows, cols, seed=seed, **kwargs)
+
+
+# --------------------------
+# GRID -> ADJACENCY ARRAYS
+# --------------------------
+def grid_csr(grid):
+    """Offsets and targets of the 4-neighbour graph over open cells.
+
+    Cell (r, c) has id r * cols + c; walls keep their id but get no edges.
+    Each cell's edges are listed in DIRECTIONS order, so searches over the
+    result visit neighbours in the same order as PathfindingVisualizer.
+    Targets are int32 unless the grid has 2**31 cells or more.
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+    dtype = np.int32 if n < 2 ** 31 - cols else np.int64
+    open_ = grid == 0
+    valid = np.zeros((rows, cols, len(DIRECTIONS)), dtype=bool)
+    for k, (dr, dc) in enumerate(DIRECTIONS):
+        src = (slice(max(0, -dr), rows - max(0, dr)), slice(max(0, -dc), cols - max(0, dc)))
+        dst = (slice(max(0, dr), rows - max(0, -dr)), slice(max(0, dc), cols - max(0, -dc)))
+        np.logical_and(open_[src], open_[dst], out=valid[src + (k,)])
+    valid = valid.reshape(n, len(DIRECTIONS))
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.count_nonzero(valid, axis=1), out=offsets[1:])
+    deltas = np.array([dr * cols + dc for dr, dc in DIRECTIONS], dtype=dtype)
+    targets = (np.arange(n, dtype=dtype)[:, None] + deltas)[valid]
+    return offsets, targets
@@ -0,0 +1,209 @@
+# --------------------------
+# NAIVE BAYES (VECTORIZED)
+# --------------------------
+# Training counts whole columns at once: a nominal feature with V values
+# over K classes is one np.bincount of class * V + value into a K x V
+# table, a numeric feature a bincount of the values and one of the squared
+# deviations per class (Gaussian likelihood). Prediction adds up per-class
+# log likelihoods for all rows as (rows, K) arrays, so nothing underflows
+# and there is no loop over rows. Missing values (code -1 / NaN) are left
+# out of the counts and add nothing to a row's score.
+#
+# Columns come as arffdata.load() gives them: integer codes for nominal
+# attributes, float arrays for numeric ones.
+#
+#   data = arffdata.load("weather.nominal.arff")
+#   model = NaiveBayes().fit(data, "play")
+#   model.predict_labels(data)                    # ['no', 'no', 'yes', ...]
+#   cross_validate(data, "play", folds=10)        # accuracy per fold
+#   leave_one_out(data, "play")
+import math
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+
+def _feature_names(data, target, features):
+    if features is not None:
+        return list(features)
+    names = data.names if hasattr(data, "names") else list(data)
+    return [name for name in names if name != target]
+
+def _categories(data, name, column):
+    """Number of values of a coded column: the declared ones for a Dataset,
+    otherwise the largest code + 1"""
+    if hasattr(data, "attribute"):
+        return len(data.attribute(name).values)
+    return int(column.max()) + 1 if column.size else 0
+
+
+class NaiveBayes:
+    """alpha is the Laplace smoothing added to every nominal count;
+    var_smoothing * the largest feature variance is added to every
+    Gaussian variance so a constant column cannot divide by zero."""
+    def __init__(self, alpha=1.0, var_smoothing=1e-9):
+        self.alpha = alpha
+        self.var_smoothing = var_smoothing
+
+    def fit(self, data, target, features=None, categories=None):
+        """Count the tables from data[target] (class codes) and the features.
+
+        data is an arffdata.Dataset or a mapping of name -> column; float
+        columns are numeric, integer ones nominal codes. categories maps
+        names to their number of values where that is not to be taken
+        from the data.
+        """
+        y = np.asarray(data[target])
+        if y.dtype.kind == "f":
+            raise ValueError(f"target {target!r} must be nominal, not numeric")
+        names = _feature_names(data, target, features)
+        if not names:
+            raise ValueError("no features to train on")
+        categories = categories or {}
+        self.target = target
+        self.features = names
+        self.classes = list(data.attribute(target).values) if hasattr(data, "attribute") else None
+        k = categories.get(target) or _categories(data, target, y)
+        labelled = y >= 0
+        # int8 codes would overflow in class * V + value
+        cls = y[labelled].astype(np.intp)
+        self.class_counts = np.bincount(cls, minlength=k)
+        self.log_prior = np.log((self.class_counts + self.alpha) / (labelled.sum() + self.alpha * k))
+
+        self.nominal, self.gaussian = [], []
+        columns = [(name, np.asarray(data[name])[labelled]) for name in names]
+        spread = max((np.nanvar(x) for _, x in columns if x.dtype.kind == "f" and x.size), default=0.0)
+        epsilon = self.var_smoothing * (spread if spread > 0 else 1.0)
+        for name, x in columns:
+            if x.dtype.kind == "f":
+                seen = ~np.isnan(x)
+                x, c = x[seen], cls[seen]
+                n = np.maximum(np.bincount(c, minlength=k), 1)
+                mean = np.bincount(c, weights=x, minlength=k) / n
+                # second pass over the deviations, steadier than E[x^2] - mean^2
+                var = np.bincount(c, weights=(x - mean[c]) ** 2, minlength=k) / n + epsilon
+                self.gaussian.append((name, mean, var))
+            else:
+                v = categories.get(name) or _categories(data, name, x)
+                seen = x >= 0
+                counts = np.bincount(cls[seen] * v + x[seen].astype(np.intp), minlength=k * v)
+                counts = counts.reshape(k, v) + self.alpha
+                # (V + 1, K): log P(value | class) by value, then a row of
+                # zeros that missing values (code -1) pick up
+                lookup = np.zeros((v + 1, k))
+                lookup[:v] = np.log(counts / counts.sum(axis=1, keepdims=True)).T
+                self.nominal.append((name, lookup))
+        return self
+
+    def joint_log_likelihood(self, data):
+        """(rows, classes) array of log P(class) + sum of log P(feature | class)"""
+        rows = len(np.asarray(data[self.features[0]]))
+        # built as (classes, rows) so every update is a contiguous 1-D pass
+        jll = np.repeat(self.log_prior[:, None], rows, axis=1)
+        for name, lookup in self.nominal:
+            x = np.asarray(data[name])
+            if x.size and x.max() >= len(lookup) - 1:
+                x = np.where(x < len(lookup) - 1, x, -1)  # values not seen in training
+            jll += lookup.T[:, x]
+        for name, mean, var in self.gaussian:
+            x = np.asarray(data[name], dtype=np.float64)
+            missing = np.flatnonzero(np.isnan(x))
+            for k in range(len(mean)):
+                term = x - mean[k]
+                term *= term
+                term *= 0.5 / var[k]
+                term += 0.5 * math.log(2 * math.pi * var[k])
+                term[missing] = 0
+                jll[k] -= term
+        return jll.T
+
+    def predict_log_proba(self, data):
+        jll = self.joint_log_likelihood(data)
+        top = jll.max(axis=1, keepdims=True)
+        return jll - (top + np.log(np.exp(jll - top).sum(axis=1, keepdims=True)))
+
+    def predict(self, data):
+        """Most likely class code of every row"""
+        return self.joint_log_likelihood(data).argmax(axis=1)
+
+    def predict_labels(self, data):
+        codes = self.predict(data)
+        if self.classes is None:
+            return codes.tolist()
+        return [self.classes[code] for code in codes.tolist()]
+
+    def score(self, data):
+        """Accuracy on the rows whose target is known"""
+        y = np.asarray(data[self.target])
+        labelled = y >= 0
+        return float((self.predict(data)[labelled] == y[labelled]).mean()) if labelled.any() else math.nan
+
+
+# --------------------------
+# CROSS-VALIDATION
+# --------------------------
+# Folds run in a process pool. The columns reach the workers once, through
+# the pool initializer; each task is only the test row indices of a fold.
+class _Rows:
+    """The chosen rows of a dict of columns"""
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+
+    def __getitem__(self, name):
+        return self.columns[name][self.rows]
+
+_worker_job = None
+
+def _init_worker(job):
+    global _worker_job
+    _worker_job = job
+
+def _run_fold(job, test):
+    """(correct, labelled) test rows after training on all the others"""
+    columns, target, features, categories, alpha = job
+    train = np.ones(len(columns[target]), dtype=bool)
+    train[test] = False
+    model = NaiveBayes(alpha).fit(_Rows(columns, train), target, features, categories)
+    truth = columns[target][test]
+    labelled = truth >= 0
+    predicted = model.predict(_Rows(columns, test))
+    return int((predicted[labelled] == truth[labelled]).sum()), int(labelled.sum())
+
+def _fold_task(test):
+    return _run_fold(_worker_job, test)
+
+def fold_indices(n, folds, seed=0):
+    """Test row indices of each fold, over one shuffle of the rows"""
+    order = np.random.default_rng(seed).permutation(n)
+    return [np.sort(part) for part in np.array_split(order, folds)]
+
+def cross_validate(data, target, folds=10, features=None, alpha=1.0, seed=0, processes=None):
+    """Accuracy of each of `folds` train/test splits, run in parallel.
+
+    processes=None uses one worker per CPU, 1 runs the folds in this
+    process. Returns a float array with one accuracy per fold.
+    """
+    features = _feature_names(data, target, features)
+    columns = {name: np.asarray(data[name]) for name in features + [target]}
+    # value counts from all rows, so no fold sees fewer categories
+    categories = {name: _categories(data, name, column)
+                  for name, column in columns.items() if column.dtype.kind != "f"}
+    job = (columns, target, features, categories, alpha)
+    tests = fold_indices(len(columns[target]), folds, seed)
+
+    processes = processes or os.cpu_count() or 1
+    if processes > 1 and len(tests) > 1:
+        with Pool(processes, initializer=_init_worker, initargs=(job,)) as pool:
+            chunksize = max(1, len(tests) // (4 * processes))
+            results = list(pool.imap(_fold_task, tests, chunksize=chunksize))
+    else:
+        results = [_run_fold(job, test) for test in tests]
+    return np.array([correct / total if total else math.nan for correct, total in results])
+
+def leave_one_out(data, target, features=None, alpha=1.0, processes=None):
+    """Leave-one-out accuracy: cross-validation with one fold per row"""
+    n = len(np.asarray(data[target]))
+    scores = cross_validate(data, target, n, features, alpha, processes=processes)
+    return float(np.nanmean(scores))
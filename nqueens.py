@@ -0,0 +1,435 @@
+# --------------------------
+# N-QUEENS SOLVERS
+# --------------------------
+# Solutions are column-index tuples: cols[row] is the column of the queen in
+# that row. Use to_board() to get the old N x N 0/1 list-of-lists form.
+import random
+import struct
+from array import array
+from itertools import islice
+from multiprocessing import Pool
+
+
+# --------------------------
+# 1. ORIGINAL RECURSIVE SOLVER (kept as the reference / benchmark baseline)
+# --------------------------
+def is_attack(i, j, board):
+    N = len(board)
+    # কলাম চেক
+    for k in range(i):
+        if board[k][j] == 1:
+            return True
+
+    # উপরের ডান দিকের ডায়াগোনাল চেক
+    k, l = i-1, j+1
+    while k >= 0 and l < N:
+        if board[k][l] == 1:
+            return True
+        k -= 1
+        l += 1
+
+    # উপরের বাম দিকের ডায়াগোনাল চেক
+    k, l = i-1, j-1
+    while k >= 0 and l >= 0:
+        if board[k][l] == 1:
+            return True
+        k -= 1
+        l -= 1
+
+    return False
+
+def n_queen(row, n, board, all_solutions):
+    if n == 0:
+        # বোর্ডের একটি কপি সংরক্ষণ করুন
+        all_solutions.append([r[:] for r in board])
+        return
+
+    for j in range(len(board)):
+        if not is_attack(row, j, board):
+            board[row][j] = 1
+
+            n_queen(row+1, n-1, board, all_solutions)
+
+            board[row][j] = 0  # ব্যাকট্র্যাকিং
+
+
+# --------------------------
+# 2. BITBOARD ENGINE
+# --------------------------
+# Occupied columns and the two diagonal directions are kept as int bitmasks,
+# so finding the free squares of a row is one AND/NOT instead of a rescan.
+# "ld" diagonals shift left and "rd" diagonals shift right on each row.
+
+def to_board(cols):
+    """Expand a column tuple into an N x N 0/1 board"""
+    n = len(cols)
+    board = [[0] * n for _ in range(n)]
+    for r, c in enumerate(cols):
+        board[r][c] = 1
+    return board
+
+def mirror(cols):
+    """Reflect a solution across the vertical axis"""
+    n = len(cols)
+    return tuple(n - 1 - c for c in cols)
+
+def _count(full, cols, ld, rd):
+    if cols == full:
+        return 1
+    total = 0
+    avail = full & ~(cols | ld | rd)
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        total += _count(full, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1)
+    return total
+
+def _solutions(n, full, cols, ld, rd, placed, out):
+    if cols == full:
+        out.append(tuple(placed))
+        return
+    avail = full & ~(cols | ld | rd)
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        placed.append(bit.bit_length() - 1)
+        _solutions(n, full, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1, placed, out)
+        placed.pop()
+
+def _subtree(n, prefix, count_only):
+    """Count or list the solutions that start with the rows in `prefix`"""
+    full = (1 << n) - 1
+    cols = ld = rd = 0
+    for c in prefix:
+        bit = 1 << c
+        if (cols | ld | rd) & bit:
+            return 0 if count_only else []
+        cols, ld, rd = cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1
+    if count_only:
+        return _count(full, cols, ld, rd)
+    out = []
+    _solutions(n, full, cols, ld, rd, list(prefix), out)
+    return out
+
+def _first_row_subtree(n, col, count_only):
+    """Count or list the solutions whose first-row queen sits in `col`"""
+    return _subtree(n, (col,), count_only)
+
+def count_solutions(n):
+    """Count all N-Queens solutions without storing any board"""
+    if n <= 0:
+        return 0
+    if n == 1:
+        return 1
+    # A solution with its first queen in column c mirrors to one in n-1-c,
+    # so only the left half of the first row is searched and doubled.
+    half = n // 2
+    total = 2 * sum(_first_row_subtree(n, c, True) for c in range(half))
+    if n % 2:
+        total += _first_row_subtree(n, half, True)
+    return total
+
+def solve(n):
+    """Return every solution as a column tuple, in lexicographic order"""
+    if n <= 0:
+        return []
+    if n == 1:
+        return [(0,)]
+    half = n // 2
+    left = []
+    for c in range(half):
+        left.extend(_first_row_subtree(n, c, False))
+    middle = _first_row_subtree(n, half, False) if n % 2 else []
+    # Mirroring reverses lexicographic order, so the right half is the
+    # reflected left half read backwards.
+    right = [mirror(s) for s in reversed(left)]
+    return left + middle + right
+
+
+# --------------------------
+# 3. PARALLEL SEARCH
+# --------------------------
+# Every placement of the first `split_depth` rows roots an independent
+# subtree. Those prefixes are handed to a process pool one at a time
+# (chunksize=1), so a worker that finishes a small subtree immediately pulls
+# the next one and the uneven subtree sizes even out across cores.
+
+def _prefixes(n, split_depth):
+    """Valid placements of the first rows, left half (and middle) of row 0 only"""
+    first = range((n + 1) // 2)
+    prefixes = [(c,) for c in first]
+    for _ in range(1, min(split_depth, n)):
+        deeper = []
+        for prefix in prefixes:
+            for c in range(n):
+                if _compatible(prefix, c):
+                    deeper.append(prefix + (c,))
+        prefixes = deeper
+    return prefixes
+
+def _compatible(prefix, col):
+    row = len(prefix)
+    return all(c != col and abs(c - col) != row - r for r, c in enumerate(prefix))
+
+def _solve_prefix(task):
+    n, prefix, count_only = task
+    return _subtree(n, prefix, count_only)
+
+def _run_parallel(n, count_only, processes, split_depth):
+    prefixes = _prefixes(n, split_depth)
+    tasks = [(n, prefix, count_only) for prefix in prefixes]
+    with Pool(processes) as pool:
+        # imap keeps results in task order, so the merge is deterministic
+        results = list(pool.imap(_solve_prefix, tasks, chunksize=1))
+    return prefixes, results
+
+def count_solutions_parallel(n, processes=None, split_depth=2):
+    """count_solutions() split across a process pool"""
+    if n <= 1:
+        return count_solutions(n)
+    prefixes, counts = _run_parallel(n, True, processes, split_depth)
+    half = n // 2
+    return sum(count if p[0] == half and n % 2 else 2 * count
+               for p, count in zip(prefixes, counts))
+
+def solve_parallel(n, processes=None, split_depth=2):
+    """solve() split across a process pool; same solutions in the same order"""
+    if n <= 1:
+        return solve(n)
+    prefixes, results = _run_parallel(n, False, processes, split_depth)
+    half = n // 2
+    left, middle = [], []
+    for p, sols in zip(prefixes, results):
+        (middle if p[0] == half and n % 2 else left).extend(sols)
+    right = [mirror(s) for s in reversed(left)]
+    return left + middle + right
+
+
+# --------------------------
+# 4. STREAMING OUTPUT
+# --------------------------
+# iter_solutions() yields one column tuple at a time, so nothing but the
+# current search path is held in memory; write_solutions() pushes them
+# straight into a (buffered) binary file object while the search runs.
+
+PACKED_MAGIC = b"NQS1"
+FORMATS = ("board", "text", "binary", "count")
+
+def _iter_subtree(n, prefix):
+    full = (1 << n) - 1
+    cols = ld = rd = 0
+    for c in prefix:
+        bit = 1 << c
+        if (cols | ld | rd) & bit:
+            return
+        cols, ld, rd = cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1
+    if cols == full:
+        yield tuple(prefix)
+        return
+
+    placed = list(prefix)
+    base = len(placed)
+    # Each stack entry is one row: its masks and the columns not yet tried.
+    stack = [(cols, ld, rd, full & ~(cols | ld | rd))]
+    while stack:
+        cols, ld, rd, avail = stack.pop()
+        del placed[base + len(stack):]
+        if not avail:
+            continue
+        bit = avail & -avail
+        stack.append((cols, ld, rd, avail ^ bit))
+        placed.append(bit.bit_length() - 1)
+        cols |= bit
+        if cols == full:
+            yield tuple(placed)
+            continue
+        ld, rd = ((ld | bit) << 1) & full, (rd | bit) >> 1
+        stack.append((cols, ld, rd, full & ~(cols | ld | rd)))
+
+def iter_solutions(n):
+    """Yield every solution as a column tuple without buffering them
+
+    Each left-half solution is followed directly by its mirror image, so the
+    order differs from solve() but the set of solutions is the same.
+    """
+    if n <= 0:
+        return
+    if n == 1:
+        yield (0,)
+        return
+    half = n // 2
+    for c in range(half):
+        for cols in _iter_subtree(n, (c,)):
+            yield cols
+            yield mirror(cols)
+    if n % 2:
+        yield from _iter_subtree(n, (half,))
+
+def _packed_typecode(n):
+    return "B" if n <= 0x100 else "H" if n <= 0x10000 else "I"
+
+def pack_solution(cols):
+    """Fixed-width little-endian record: one byte per row up to N=256"""
+    record = array(_packed_typecode(len(cols)), cols)
+    if struct.pack("=H", 1) != struct.pack("<H", 1):
+        record.byteswap()
+    return record.tobytes()
+
+def read_packed(f):
+    """Yield the column tuples stored in a binary stream written by write_solutions()"""
+    magic, n = struct.unpack("<4sI", f.read(8))
+    if magic != PACKED_MAGIC:
+        raise ValueError("not a packed N-Queens solution stream")
+    typecode = _packed_typecode(n)
+    size = n * array(typecode).itemsize
+    while True:
+        record = f.read(size)
+        if len(record) < size:
+            return
+        cols = array(typecode)
+        cols.frombytes(record)
+        if struct.pack("=H", 1) != struct.pack("<H", 1):
+            cols.byteswap()
+        yield tuple(cols)
+
+def write_solutions(n, out, fmt="text", limit=None, solutions=None):
+    """Stream solutions for N into the binary file object `out`, return how many
+
+    fmt is one of FORMATS: "board" prints 0/1 rows, "text" one line of
+    column indices per solution, "binary" an 8-byte header followed by
+    pack_solution() records, and "count" only the total. `solutions`
+    defaults to iter_solutions(n).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}, expected one of {FORMATS}")
+    if fmt == "count" and limit is None and solutions is None:
+        total = count_solutions(n)
+        out.write(f"{total}\n".encode())
+        return total
+
+    if solutions is None:
+        solutions = iter_solutions(n)
+    if limit is not None:
+        solutions = islice(solutions, limit)
+
+    total = 0
+    if fmt == "binary":
+        out.write(struct.pack("<4sI", PACKED_MAGIC, n))
+        for cols in solutions:
+            out.write(pack_solution(cols))
+            total += 1
+    elif fmt == "text":
+        for cols in solutions:
+            out.write((" ".join(map(str, cols)) + "\n").encode())
+            total += 1
+    elif fmt == "board":
+        for total, cols in enumerate(solutions, 1):
+            rows = "\n".join(str(row) for row in to_board(cols))
+            out.write(f"Solution {total}:\n{rows}\n\n".encode())
+    else:
+        total = sum(1 for _ in solutions)
+        out.write(f"{total}\n".encode())
+    return total
+
+
+# --------------------------
+# 5. FIND-ONE MODE (MIN-CONFLICTS)
+# --------------------------
+# For large N only a single placement is wanted, which backtracking cannot
+# deliver. Queens are kept as a permutation (one per row and column) and the
+# two diagonal occupancy counts live in flat lists, so moving a queen is an
+# O(1) counter update instead of an is_attack()-style rescan. A greedy pass
+# places most queens conflict-free, then random swaps that lower the number
+# of attacking pairs repair the rest.
+
+def is_valid(cols):
+    """True if `cols` places N mutually non-attacking queens on an N x N board"""
+    n = len(cols)
+    return (all(0 <= c < n for c in cols)
+            and len(set(cols)) == n
+            and len({r + c for r, c in enumerate(cols)}) == n
+            and len({r - c for r, c in enumerate(cols)}) == n)
+
+def _min_conflicts_attempt(n, rng, max_sweeps):
+    off = n - 1
+    cols = list(range(n))
+    up = [0] * (2 * n - 1)    # queens on each r + c diagonal
+    down = [0] * (2 * n - 1)  # queens on each r - c diagonal
+    rand = rng.random
+
+    # Greedy phase: pick a random unused column for each row and keep it if
+    # both diagonals are free. The last few rows rarely find a free square,
+    # so they are left to the repair phase instead of burning tries.
+    placed = 0
+    greedy_rows = n - min(50, n // 4)
+    tries = int(3.08 * n)
+    while placed < greedy_rows and tries:
+        tries -= 1
+        m = placed + int(rand() * (n - placed))
+        c = cols[m]
+        if not up[placed + c] and not down[placed - c + off]:
+            cols[m] = cols[placed]
+            cols[placed] = c
+            up[placed + c] = down[placed - c + off] = 1
+            placed += 1
+    collisions = 0
+    for r in range(placed, n):
+        c = cols[r]
+        collisions += up[r + c] + down[r - c + off]
+        up[r + c] += 1
+        down[r - c + off] += 1
+
+    def swap(i, j):
+        """Swap the columns of rows i and j, return the change in attacking pairs"""
+        ci, cj = cols[i], cols[j]
+        delta = 0
+        up[i + ci] -= 1
+        down[i - ci + off] -= 1
+        up[j + cj] -= 1
+        down[j - cj + off] -= 1
+        delta -= up[i + ci] + down[i - ci + off] + up[j + cj] + down[j - cj + off]
+        delta += up[i + cj] + down[i - cj + off]
+        up[i + cj] += 1
+        down[i - cj + off] += 1
+        delta += up[j + ci] + down[j - ci + off]
+        up[j + ci] += 1
+        down[j - ci + off] += 1
+        cols[i], cols[j] = cj, ci
+        return delta
+
+    for _ in range(max_sweeps):
+        if not collisions:
+            return cols
+        attacked = [r for r in range(n) if up[r + cols[r]] > 1 or down[r - cols[r] + off] > 1]
+        for i in attacked:
+            if up[i + cols[i]] < 2 and down[i - cols[i] + off] < 2:
+                continue
+            for _ in range(100):
+                j = int(rand() * n)
+                if j == i:
+                    continue
+                delta = swap(i, j)
+                if delta < 0:
+                    collisions += delta
+                    break
+                swap(i, j)
+    return cols if not collisions else None
+
+def min_conflicts(n, seed=None, max_restarts=100, max_sweeps=50):
+    """Find one solution for N queens by local search, or None if it gives up"""
+    if n == 1:
+        return (0,)
+    if n in (2, 3) or n <= 0:
+        return None
+    rng = random.Random(seed)
+    for _ in range(max_restarts):
+        cols = _min_conflicts_attempt(n, rng, max_sweeps)
+        if cols is not None and is_valid(cols):
+            return tuple(cols)
+    return None
+
+def find_one(n, seed=None):
+    """Return a single solution (or None): backtracking for small N, min-conflicts otherwise"""
+    if n < 10:
+        return next(iter_solutions(n), None)
+    return min_conflicts(n, seed)
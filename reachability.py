@@ -0,0 +1,219 @@
+# --------------------------
+# REACHABILITY INDEX
+# --------------------------
+# Connected-component labels kept next to a maze so a search can be skipped
+# in O(1) when start and goal cannot be connected.
+#
+# Every node has a component label and labels are merged with a union-find,
+# so adding connections is cheap. GridReachability also handles cells
+# turning into walls, which can split a component: only the pieces cut off
+# from the rest are given new labels (see close_cell).
+from collections import deque
+
+# Neighbour order of PathfindingVisualizer.bfs(), shared by every grid
+# module; defined here because this module needs no NumPy
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+class ComponentIndex:
+    """Undirected components over node ids 0..n-1 (label -1 = no component)"""
+    def __init__(self, n):
+        self.label = list(range(n))
+        self.parent = list(range(n))  # union-find over labels
+        self.size = [1] * n
+
+    @classmethod
+    def from_csr(cls, num_nodes, offsets, targets):
+        """Weakly connected components of a CSR graph.
+
+        For directed graphs this is a necessary condition only: different
+        components mean unreachable, the same component proves nothing.
+        """
+        index = cls(num_nodes)
+        # union() inlined: labels start out as the node ids, so the
+        # union-find runs on ids directly, one find per source node
+        parent, size = index.parent, index.size
+        start = offsets[0]
+        for u in range(num_nodes):
+            end = offsets[u + 1]
+            if start == end:
+                continue
+            ru = u
+            while parent[ru] != ru:
+                parent[ru] = parent[parent[ru]]
+                ru = parent[ru]
+            for v in targets[start:end]:
+                while parent[v] != v:
+                    parent[v] = parent[parent[v]]
+                    v = parent[v]
+                if v != ru:
+                    if size[ru] < size[v]:
+                        ru, v = v, ru
+                    parent[v] = ru
+                    size[ru] += size[v]
+            start = end
+        return index
+
+    def _find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def _new_label(self):
+        self.parent.append(len(self.parent))
+        self.size.append(0)
+        return len(self.parent) - 1
+
+    def union(self, a, b):
+        la, lb = self.label[a], self.label[b]
+        if la < 0 or lb < 0:
+            return
+        ra, rb = self._find(la), self._find(lb)
+        if ra != rb:
+            if self.size[ra] < self.size[rb]:
+                ra, rb = rb, ra
+            self.parent[rb] = ra
+            self.size[ra] += self.size[rb]
+
+    def component(self, a):
+        """Canonical component of node a, or -1"""
+        la = self.label[a]
+        return -1 if la < 0 else self._find(la)
+
+    def same(self, a, b):
+        ca = self.component(a)
+        return ca >= 0 and ca == self.component(b)
+
+    def same_many(self, pairs):
+        """same() for each (a, b) in pairs"""
+        return [self.same(a, b) for a, b in pairs]
+
+    def components(self, ids):
+        """component() for each id, e.g. to group many queries at once"""
+        return [self.component(i) for i in ids]
+
+
+class GridReachability(ComponentIndex):
+    """Components of the open cells of a 0/1 wall grid, kept up to date.
+
+    Cells are given as (r, c); ids are r * cols + c.
+    """
+    def __init__(self, maze):
+        self.rows = len(maze)
+        self.cols = len(maze[0]) if self.rows else 0
+        super().__init__(self.rows * self.cols)
+        self.open = bytearray(self.rows * self.cols)
+        cols = self.cols
+        for r, row in enumerate(maze):
+            for c, cell in enumerate(row):
+                if not cell:
+                    self.open[r * cols + c] = 1
+        for i in range(self.rows * cols):
+            if not self.open[i]:
+                self.label[i] = -1
+                self.size[i] = 0
+        for i in range(self.rows * cols):
+            if self.open[i]:
+                if i % cols + 1 < cols and self.open[i + 1]:
+                    self.union(i, i + 1)
+                if i + cols < self.rows * cols and self.open[i + cols]:
+                    self.union(i, i + cols)
+
+    def _id(self, cell):
+        r, c = cell
+        return r * self.cols + c if 0 <= r < self.rows and 0 <= c < self.cols else None
+
+    def _neighbors(self, i):
+        r, c = divmod(i, self.cols)
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                yield nr * self.cols + nc
+
+    def connected(self, a, b):
+        """True if cells a and b are open and joined by open cells"""
+        ia, ib = self._id(a), self._id(b)
+        return ia is not None and ib is not None and self.same(ia, ib)
+
+    def connected_many(self, pairs):
+        return [self.connected(a, b) for a, b in pairs]
+
+    def set_cell(self, cell, wall):
+        if wall:
+            self.close_cell(cell)
+        else:
+            self.open_cell(cell)
+
+    def open_cell(self, cell):
+        i = self._id(cell)
+        if self.open[i]:
+            return
+        self.open[i] = 1
+        self.label[i] = self._new_label()
+        self.size[self.label[i]] = 1
+        for j in self._neighbors(i):
+            if self.open[j]:
+                self.union(i, j)
+
+    def close_cell(self, cell):
+        """Turn a cell into a wall and split its component if needed.
+
+        One BFS per open neighbour runs in lockstep. Searches that touch
+        merge into one group; a group that runs out of cells before meeting
+        the others is a cut-off piece and gets a fresh label. The work is
+        bounded by the size of the pieces that split off, not of the whole
+        component.
+        """
+        i = self._id(cell)
+        if not self.open[i]:
+            return
+        self.open[i] = 0
+        self.label[i] = -1
+        seeds = [j for j in self._neighbors(i) if self.open[j]]
+        if len(seeds) < 2:
+            return
+
+        group = list(range(len(seeds)))  # tiny union-find over the searches
+        def find(g):
+            while group[g] != g:
+                g = group[g]
+            return g
+
+        owner = {}
+        queues = []
+        for k, s in enumerate(seeds):
+            if s in owner:
+                group[find(k)] = find(owner[s])
+                queues.append(deque())
+            else:
+                owner[s] = k
+                queues.append(deque([s]))
+        done = set()
+
+        while len({find(k) for k in range(len(seeds))} - done) > 1:
+            for k, queue in enumerate(queues):
+                if not queue:
+                    continue
+                u = queue.popleft()
+                for v in self._neighbors(u):
+                    if not self.open[v]:
+                        continue
+                    if v not in owner:
+                        owner[v] = k
+                        queue.append(v)
+                    elif find(owner[v]) != find(k):
+                        group[find(owner[v])] = find(k)
+            # a group whose searches have all run dry is a separate piece
+            for g in {find(k) for k in range(len(seeds))} - done:
+                members = [k for k in range(len(seeds)) if find(k) == g]
+                if all(not queues[k] for k in members):
+                    done.add(g)
+                    if len({find(k) for k in range(len(seeds))} - done) == 0:
+                        break  # the last piece keeps the old label
+                    label = self._new_label()
+                    for v, k in owner.items():
+                        if find(k) == g:
+                            self.label[v] = label
+                            self.size[label] += 1
@@ -0,0 +1,822 @@
+# --------------------------
+# HEADLESS SEARCH CORE
+# --------------------------
+# Graphs, searches, batch queries and maze generators with no GUI or
+# plotting imports, so batch jobs and pool workers start quickly. The
+# visualization and Tk front end (Untitled-1.py) re-exports all of it.
+#
+#   from searchcore import AStar, generate_maze
+#   python check_importtime.py      # cold-start budget for this module
+import heapq
+import itertools
+import math
+import random
+import time
+from array import array
+from collections import deque
+
+from reachability import ComponentIndex
+
+
+# --------------------------
+# 1. CORE GRAPH & ALGORITHMS
+# --------------------------
+class Graph:
+    def __init__(self):
+        self.nodes = set()
+        self.edges = {}
+        self.pos = {}  # For visualization
+        self._compact = None
+
+    def add_edge(self, u, v, cost=1):
+        if u not in self.edges:
+            self.edges[u] = []
+        self.edges[u].append((v, cost))
+        self.nodes.update([u, v])
+        self._compact = None
+
+    def set_positions(self, pos_dict):
+        self.pos = pos_dict
+
+    def compact(self):
+        """CSRGraph with the same edges, rebuilt only after add_edge()"""
+        if self._compact is None:
+            self._compact = CSRGraph.from_graph(self)
+        return self._compact
+
+class CSRGraph:
+    """Adjacency in compressed sparse row form over integer node ids.
+
+    The edges leaving node i are targets[offsets[i]:offsets[i+1]], with the
+    matching entries of costs. Grid graphs (shape=(rows, cols)) number cell
+    (r, c) as r * cols + c and keep no per-node objects at all; other graphs
+    keep an id -> node list and the reverse dict.
+    """
+    def __init__(self, offsets, targets, costs, nodes=None, shape=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.costs = costs
+        self.shape = shape
+        self.node_list = nodes
+        self.index = None if nodes is None else {node: i for i, node in enumerate(nodes)}
+        self.num_nodes = len(offsets) - 1
+
+    @classmethod
+    def from_graph(cls, graph):
+        nodes = []
+        seen = set()
+        for u, adj in graph.edges.items():
+            for node in [u] + [v for v, _ in adj]:
+                if node not in seen:
+                    seen.add(node)
+                    nodes.append(node)
+        for node in graph.nodes:
+            if node not in seen:
+                nodes.append(node)
+        index = {node: i for i, node in enumerate(nodes)}
+
+        offsets = array("l", [0])
+        targets = array("l")
+        costs = array("d")
+        for node in nodes:
+            for v, cost in graph.edges.get(node, ()):
+                targets.append(index[v])
+                costs.append(cost)
+            offsets.append(len(targets))
+        csr = cls(offsets, targets, costs, nodes=nodes)
+        csr.pos = graph.pos
+        return csr
+
+    def compact(self):
+        return self
+
+    def unit_costs(self):
+        """True if every edge costs 1, so plain BFS gives shortest distances"""
+        if self._unit_costs is None:
+            self._unit_costs = all(cost == 1 for cost in self.costs)
+        return self._unit_costs
+
+    def components(self):
+        """Weakly connected components (ComponentIndex), built once and cached"""
+        if self._components is None:
+            self._components = ComponentIndex.from_csr(self.num_nodes, self.offsets, self.targets)
+        return self._components
+
+    def reversed(self):
+        """CSRGraph with every edge flipped, built once and cached"""
+        if self._reverse is None:
+            n = self.num_nodes
+            offsets, targets, costs = self.offsets, self.targets, self.costs
+            counts = array("l", [0]) * (n + 1)
+            for v in targets:
+                counts[v + 1] += 1
+            for i in range(n):
+                counts[i + 1] += counts[i]
+            fill = array("l", counts)
+            rev_targets = array("l", [0]) * len(targets)
+            rev_costs = array("d", [0.0]) * len(targets)
+            for u in range(n):
+                for k in range(offsets[u], offsets[u + 1]):
+                    slot = fill[targets[k]]
+                    rev_targets[slot] = u
+                    rev_costs[slot] = costs[k]
+                    fill[targets[k]] = slot + 1
+            rev = CSRGraph(counts, rev_targets, rev_costs, shape=self.shape)
+            rev.node_list, rev.index, rev.pos = self.node_list, self.index, self._pos
+            rev._reverse = self
+            self._reverse = rev
+        return self._reverse
+
+    def id_of(self, node):
+        """Integer id of `node`, or None if it is not in the graph"""
+        if self.shape is None:
+            return self.index.get(node)
+        r, c = node
+        rows, cols = self.shape
+        return r * cols + c if 0 <= r < rows and 0 <= c < cols else None
+
+    def node_of(self, i):
+        if self.shape is None:
+            return self.node_list[i]
+        return divmod(i, self.shape[1])
+
+    @property
+    def nodes(self):
+        if self.shape is None:
+            return self.node_list
+        return [self.node_of(i) for i in range(self.num_nodes)]
+
+    @property
+    def pos(self):
+        if self.shape is not None and self._pos is None:
+            self._pos = {(r, c): (c, -r) for r in range(self.shape[0]) for c in range(self.shape[1])}
+        return self._pos
+
+    @pos.setter
+    def pos(self, pos_dict):
+        self._pos = pos_dict
+
+    _pos = None
+    _reverse = None
+    _components = None
+    _unit_costs = None
+    grid = None  # 0/1 wall array when built from a grid
+
+class SearchAlgorithm:
+    """Base class; searches run on graph.compact() with flat per-id arrays.
+
+    After a search, `visited` is a bytearray indexed by node id, `path` the
+    list of nodes from start to goal (empty if unreachable) and:
+
+      expanded      nodes taken off the frontier and expanded
+      pushes        entries put on the frontier
+      stale_pops    entries popped but skipped (already expanded)
+      max_frontier  the largest the queue/stack/open list got
+      phases        seconds spent in "prepare", "search" and "trace"
+
+    on_expand(node), on_push(node) and on_goal(path) are optional hooks; a
+    disabled hook costs one `is not None` test. With sample=k the expand
+    and push hooks only fire on every k-th event.
+    """
+    on_expand = None
+    on_push = None
+    on_goal = None
+    sample = 1
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.visited = bytearray()
+        self.path = []
+        self.time_taken = 0
+        self.expanded = 0
+        self.pushes = 0
+        self.stale_pops = 0
+        self.max_frontier = 0
+        self.phases = {}
+
+    def instrument(self, on_expand=None, on_push=None, on_goal=None, sample=1):
+        """Set (or with no arguments clear) the event hooks; returns self"""
+        self.on_expand, self.on_push, self.on_goal = on_expand, on_push, on_goal
+        self.sample = sample
+        return self
+
+    def stats(self):
+        """Counters of the last search as a dict"""
+        return {
+            "expanded": self.expanded,
+            "pushes": self.pushes,
+            "stale_pops": self.stale_pops,
+            "max_frontier": self.max_frontier,
+            "path_length": len(self.path),
+            "time": self.time_taken,
+            **{f"{phase}_time": seconds for phase, seconds in self.phases.items()}
+        }
+
+    def search(self, start, goal):
+        raise NotImplementedError
+
+    def steps(self, start, goal):
+        """Stream of ("expand", node) in search order, then ("path", node)
+        along the path, e.g. to animate a search one event at a time.
+
+        The search runs on a background thread as the events are read (see
+        searchworker.EventStream); leave this object alone until the
+        stream is exhausted or closed.
+        """
+        from searchworker import EventStream  # threads, only for animations
+
+        def produce(emit):
+            saved = self.on_expand, self.on_push, self.on_goal, self.sample
+            self.instrument(on_expand=lambda node: emit(("expand", node)))
+            try:
+                path = self.search(start, goal)
+            finally:
+                self.instrument(*saved)
+            for node in path:
+                emit(("path", node))
+        return EventStream(produce)
+
+    def _hooks(self):
+        """(on_expand, on_push) wrapped for sampling, for binding to locals"""
+        on_expand, on_push, k = self.on_expand, self.on_push, self.sample
+        if k > 1:
+            on_expand = on_expand and self._sampled(on_expand, k)
+            on_push = on_push and self._sampled(on_push, k)
+        return on_expand, on_push
+
+    @staticmethod
+    def _sampled(fn, k):
+        count = itertools.count(1)
+        def hook(node):
+            if next(count) % k == 0:
+                fn(node)
+        return hook
+
+    def _mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = now - self._last_mark
+        self._last_mark = now
+
+    def _prepare(self, start, goal):
+        """Return (csr, start id, goal id) and reset the visited array.
+
+        The goal id comes back as None when the component index already
+        shows it cannot be reached, so the search returns at once.
+        """
+        self._last_mark = time.perf_counter()
+        self.phases = {}
+        csr = self.graph.compact()
+        self.visited = bytearray(csr.num_nodes)
+        self.expanded = self.pushes = self.stale_pops = self.max_frontier = 0
+        self.path = []
+        s, g = csr.id_of(start), csr.id_of(goal)
+        if s is not None and g is not None and s != g and not csr.components().same(s, g):
+            g = None
+        self._mark("prepare")
+        return csr, s, g
+
+    def _trace(self, csr, parent, goal_id):
+        """Walk parent pointers back from the goal to rebuild the node path"""
+        if "search" not in self.phases:
+            self._mark("search")
+        path = []
+        i = goal_id
+        while i != -1:
+            path.append(csr.node_of(i))
+            i = parent[i]
+        path.reverse()
+        return path
+
+    def _finish(self, path, start_time):
+        """Record the result (also for a failed search, with path [])"""
+        if "search" not in self.phases:
+            self._mark("search")
+        self._mark("trace")
+        self.time_taken = time.time() - start_time
+        self.path = path
+        if path and self.on_goal is not None:
+            self.on_goal(path)
+        return path
+
+class BFS(SearchAlgorithm):
+    def search(self, start, goal):
+        start_time = time.time()
+        csr, s, g = self._prepare(start, goal)
+        if start == goal:
+            return self._finish([start], start_time)
+        if s is None or g is None:
+            return self._finish([], start_time)
+        offsets, targets, visited = csr.offsets, csr.targets, self.visited
+        on_expand, on_push = self._hooks()
+        parent = array("l", [-1]) * csr.num_nodes
+        queue = deque([s])
+        visited[s] = 1
+
+        while queue:
+            if len(queue) > self.max_frontier:
+                self.max_frontier = len(queue)
+            node = queue.popleft()
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(csr.node_of(node))
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = node
+                    if on_push is not None:
+                        on_push(csr.node_of(neighbor))
+                    if neighbor == g:
+                        self.pushes = visited.count(1)  # every marked node was queued once
+                        return self._finish(self._trace(csr, parent, g), start_time)
+                    queue.append(neighbor)
+        self.pushes = visited.count(1)
+        return self._finish([], start_time)
+
+class DFS(SearchAlgorithm):
+    def search(self, start, goal):
+        start_time = time.time()
+        csr, s, g = self._prepare(start, goal)
+        if start == goal:
+            return self._finish([start], start_time)
+        if s is None or g is None:
+            return self._finish([], start_time)
+        offsets, targets, visited = csr.offsets, csr.targets, self.visited
+        on_expand, on_push = self._hooks()
+        parent = array("l", [-1]) * csr.num_nodes
+        # (node, node it was pushed from); parent is fixed when first popped
+        stack = [(s, -1)]
+        self.pushes = 1
+
+        while stack:
+            if len(stack) > self.max_frontier:
+                self.max_frontier = len(stack)
+            node, from_node = stack.pop()
+            if visited[node]:
+                self.stale_pops += 1
+                continue
+            visited[node] = 1
+            parent[node] = from_node
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(csr.node_of(node))
+            if node == g:
+                return self._finish(self._trace(csr, parent, g), start_time)
+            neighbors = targets[offsets[node]:offsets[node + 1]]
+            self.pushes += len(neighbors)
+            for neighbor in reversed(neighbors):
+                stack.append((neighbor, node))
+                if on_push is not None:
+                    on_push(csr.node_of(neighbor))
+        return self._finish([], start_time)
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+def octile(a, b):
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+def euclidean(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+def zero(a, b):
+    return 0  # A* with this heuristic is Dijkstra's algorithm
+
+SQRT2 = math.sqrt(2)
+HEURISTICS = {"manhattan": manhattan, "octile": octile, "euclidean": euclidean, "zero": zero}
+
+class AStar(SearchAlgorithm):
+    """Weighted A* over edge costs.
+
+    `heuristic` is a name from HEURISTICS or a function (a, b) -> estimate.
+    weight > 1 inflates the heuristic: fewer expansions, and the path cost
+    stays within `weight` times the optimum for an admissible heuristic.
+    """
+    def __init__(self, graph, heuristic="manhattan", weight=1.0):
+        super().__init__(graph)
+        self.heuristic_fn = HEURISTICS[heuristic] if isinstance(heuristic, str) else heuristic
+        self.weight = weight
+        self.cost = math.inf
+
+    def heuristic(self, a, b):
+        return self.heuristic_fn(a, b)
+
+    def search(self, start, goal):
+        start_time = time.time()
+        csr, s, g = self._prepare(start, goal)
+        if start == goal:
+            self.cost = 0
+            return self._finish([start], start_time)
+        if s is None or g is None:
+            self.cost = math.inf
+            return self._finish([], start_time)
+        offsets, targets, costs, visited = csr.offsets, csr.targets, csr.costs, self.visited
+        on_expand, on_push = self._hooks()
+        parent = array("l", [-1]) * csr.num_nodes
+        g_score = array("d", [math.inf]) * csr.num_nodes
+        g_score[s] = 0
+        h, w, node_of = self.heuristic_fn, self.weight, csr.node_of
+        # Entries are (f, h, counter, node): on equal f the node closer to
+        # the goal wins, then the earlier push, so nodes are never compared.
+        counter = itertools.count()
+        h_start = w * h(start, goal)
+        open_set = [(h_start, h_start, next(counter), s)]
+        self.pushes = 1
+
+        while open_set:
+            if len(open_set) > self.max_frontier:
+                self.max_frontier = len(open_set)
+            _, _, _, node = heapq.heappop(open_set)
+            if visited[node]:
+                self.stale_pops += 1
+                continue  # stale entry, a cheaper one was already expanded
+            visited[node] = 1
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(node_of(node))
+            if node == g:
+                self.cost = g_score[g]
+                return self._finish(self._trace(csr, parent, g), start_time)
+            g_node = g_score[node]
+            for k in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[k]
+                if visited[neighbor]:
+                    continue
+                tentative = g_node + costs[k]
+                if tentative < g_score[neighbor]:
+                    g_score[neighbor] = tentative
+                    parent[neighbor] = node
+                    h_neighbor = w * h(node_of(neighbor), goal)
+                    heapq.heappush(open_set, (tentative + h_neighbor, h_neighbor, next(counter), neighbor))
+                    self.pushes += 1
+                    if on_push is not None:
+                        on_push(node_of(neighbor))
+        self.cost = math.inf
+        return self._finish([], start_time)
+
+class BidirectionalBFS(SearchAlgorithm):
+    """BFS grown a whole layer at a time from both ends.
+
+    The smaller frontier is expanded each round over forward edges (from the
+    start) or reversed edges (from the goal). Once a layer produces a node
+    already reached from the other side, the best meeting point of that
+    layer gives a shortest path.
+    """
+    def search(self, start, goal):
+        start_time = time.time()
+        csr, s, g = self._prepare(start, goal)
+        if start == goal:
+            return self._finish([start], start_time)
+        if s is None or g is None:
+            return self._finish([], start_time)
+        rev = csr.reversed()
+        n = csr.num_nodes
+        # side 0 searches from the start, side 1 from the goal; parent[1]
+        # points one step closer to the goal.
+        dist = (array("l", [-1]) * n, array("l", [-1]) * n)
+        parent = (array("l", [-1]) * n, array("l", [-1]) * n)
+        graphs = (csr, rev)
+        frontier = [[s], [g]]
+        dist[0][s] = dist[1][g] = 0
+        self.visited[s] = self.visited[g] = 1
+        self.pushes = 2
+        on_expand, on_push = self._hooks()
+
+        best, meet = -1, -1
+        while frontier[0] and frontier[1] and best == -1:
+            if len(frontier[0]) + len(frontier[1]) > self.max_frontier:
+                self.max_frontier = len(frontier[0]) + len(frontier[1])
+            side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+            offsets, targets = graphs[side].offsets, graphs[side].targets
+            mine, other, par = dist[side], dist[1 - side], parent[side]
+            layer = []
+            for node in frontier[side]:
+                self.expanded += 1
+                if on_expand is not None:
+                    on_expand(csr.node_of(node))
+                d = mine[node] + 1
+                for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                    if mine[neighbor] != -1:
+                        continue
+                    mine[neighbor] = d
+                    par[neighbor] = node
+                    self.visited[neighbor] = 1
+                    layer.append(neighbor)
+                    if on_push is not None:
+                        on_push(csr.node_of(neighbor))
+                    if other[neighbor] != -1 and (best == -1 or d + other[neighbor] < best):
+                        best, meet = d + other[neighbor], neighbor
+            self.pushes += len(layer)
+            frontier[side] = layer
+
+        if best == -1:
+            return self._finish([], start_time)
+        return self._finish(self._join(csr, parent[0], parent[1], meet, meet), start_time)
+
+    def _join(self, csr, parent_fwd, parent_bwd, fwd_node, bwd_node):
+        """Forward chain to fwd_node, then the backward chain from bwd_node"""
+        path = self._trace(csr, parent_fwd, fwd_node)
+        i = bwd_node if bwd_node != fwd_node else parent_bwd[bwd_node]
+        while i != -1:
+            path.append(csr.node_of(i))
+            i = parent_bwd[i]
+        return path
+
+class BidirectionalAStar(BidirectionalBFS):
+    """A* from both ends over edge costs, alternating on the smaller open list.
+
+    The forward search aims at the goal and the backward one (over reversed
+    edges) at the start. mu is the cheapest start-goal connection seen so
+    far; the search stops once the smallest f on either open list reaches
+    it, which with a consistent heuristic means mu is optimal.
+    """
+    def __init__(self, graph, heuristic="manhattan"):
+        super().__init__(graph)
+        self.heuristic_fn = HEURISTICS[heuristic] if isinstance(heuristic, str) else heuristic
+        self.cost = math.inf
+
+    def search(self, start, goal):
+        start_time = time.time()
+        csr, s, g = self._prepare(start, goal)
+        self.cost = math.inf
+        if start == goal:
+            self.cost = 0
+            return self._finish([start], start_time)
+        if s is None or g is None:
+            return self._finish([], start_time)
+        rev = csr.reversed()
+        n = csr.num_nodes
+        h, node_of, visited = self.heuristic_fn, csr.node_of, self.visited
+        graphs = (csr, rev)
+        aim = (goal, start)  # each side's heuristic points at the other end
+        g_score = (array("d", [math.inf]) * n, array("d", [math.inf]) * n)
+        parent = (array("l", [-1]) * n, array("l", [-1]) * n)
+        closed = (bytearray(n), bytearray(n))
+        counter = itertools.count()
+        g_score[0][s] = g_score[1][g] = 0
+        open_sets = ([(h(start, goal), 0, next(counter), s)], [(h(goal, start), 0, next(counter), g)])
+        self.pushes = 2
+        on_expand, on_push = self._hooks()
+
+        mu, meet = math.inf, (-1, -1)
+        while open_sets[0] and open_sets[1]:
+            for side in (0, 1):
+                heap = open_sets[side]
+                while heap and closed[side][heap[0][3]]:
+                    heapq.heappop(heap)  # stale entries
+                    self.stale_pops += 1
+            if not open_sets[0] or not open_sets[1]:
+                break
+            if mu <= max(open_sets[0][0][0], open_sets[1][0][0]):
+                break
+
+            if len(open_sets[0]) + len(open_sets[1]) > self.max_frontier:
+                self.max_frontier = len(open_sets[0]) + len(open_sets[1])
+            side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+            _, _, _, node = heapq.heappop(open_sets[side])
+            closed[side][node] = 1
+            visited[node] = 1
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(node_of(node))
+            mine, other = g_score[side], g_score[1 - side]
+            if mine[node] + other[node] < mu:
+                mu = mine[node] + other[node]
+                meet = (node, node)
+            graph = graphs[side]
+            offsets, targets, costs = graph.offsets, graph.targets, graph.costs
+            for k in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[k]
+                if closed[side][neighbor]:
+                    continue
+                tentative = mine[node] + costs[k]
+                if tentative < mine[neighbor]:
+                    mine[neighbor] = tentative
+                    parent[side][neighbor] = node
+                    h_neighbor = h(node_of(neighbor), aim[side])
+                    heapq.heappush(open_sets[side], (tentative + h_neighbor, h_neighbor, next(counter), neighbor))
+                    self.pushes += 1
+                    if on_push is not None:
+                        on_push(node_of(neighbor))
+                if tentative + other[neighbor] < mu:
+                    mu = tentative + other[neighbor]
+                    # keep the joining edge explicit: its tail is on the
+                    # forward side, its head on the backward side
+                    meet = (node, neighbor) if side == 0 else (neighbor, node)
+
+        if mu == math.inf:
+            return self._finish([], start_time)
+        self.cost = mu
+        return self._finish(self._join(csr, parent[0], parent[1], *meet), start_time)
+
+# --------------------------
+# BATCH QUERIES
+# --------------------------
+# One single-source expansion answers every target from the same source;
+# distances come back as flat arrays aligned with the targets, and paths are
+# only rebuilt on request from the shared parent array.
+
+class ShortestPathTree:
+    """Distances and parent pointers from one source, as flat per-id arrays"""
+    def __init__(self, csr, source, dist, parent):
+        self.csr = csr
+        self.source = source  # node, as passed in
+        self.dist = dist      # array('d'), inf where not settled
+        self.parent = parent  # array('l'), -1 at the source / unreached
+
+    def distance(self, node):
+        if node == self.source:
+            return 0.0
+        i = self.csr.id_of(node)
+        return math.inf if i is None else self.dist[i]
+
+    def path(self, node):
+        """Node path from the source, or [] if the node was not reached"""
+        if node == self.source:
+            return [node]
+        i = self.csr.id_of(node)
+        if i is None or self.dist[i] == math.inf:
+            return []
+        path = []
+        while i != -1:
+            path.append(self.csr.node_of(i))
+            i = self.parent[i]
+        path.reverse()
+        return path
+
+def shortest_path_tree(graph, source, targets=None):
+    """BFS (unit costs) or Dijkstra from source, stopping once every target is settled.
+
+    Targets in another component (or not in the graph) are dropped up front,
+    so they never keep the expansion running.
+    """
+    csr = graph.compact()
+    n = csr.num_nodes
+    dist = array("d", [math.inf]) * n
+    parent = array("l", [-1]) * n
+    s = csr.id_of(source)
+    tree = ShortestPathTree(csr, source, dist, parent)
+    if s is None:
+        return tree
+
+    pending = None
+    if targets is not None:
+        components = csr.components()
+        pending = set()
+        for t in targets:
+            i = csr.id_of(t)
+            if i is not None and components.same(s, i):
+                pending.add(i)
+        pending.discard(s)
+    dist[s] = 0
+    if pending is not None and not pending:
+        return tree
+
+    offsets, targets_, costs = csr.offsets, csr.targets, csr.costs
+    if csr.unit_costs():
+        queue = deque([s])
+        while queue:
+            node = queue.popleft()
+            d = dist[node] + 1
+            for neighbor in targets_[offsets[node]:offsets[node + 1]]:
+                if dist[neighbor] == math.inf:
+                    dist[neighbor] = d
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+                    if pending is not None:
+                        pending.discard(neighbor)
+                        if not pending:
+                            return tree
+        return tree
+
+    settled = bytearray(n)
+    heap = [(0.0, s)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if settled[node]:
+            continue
+        settled[node] = 1
+        if pending is not None:
+            pending.discard(node)
+            if not pending:
+                break
+        for k in range(offsets[node], offsets[node + 1]):
+            neighbor = targets_[k]
+            nd = d + costs[k]
+            if nd < dist[neighbor]:
+                dist[neighbor] = nd
+                parent[neighbor] = node
+                heapq.heappush(heap, (nd, neighbor))
+    # Anything reached but not settled before stopping is only an upper bound
+    for i in range(n):
+        if not settled[i]:
+            dist[i] = math.inf
+            parent[i] = -1
+    return tree
+
+def one_to_many(graph, source, targets):
+    """Distances from source to each target as array('d') (inf = unreachable), plus the tree"""
+    tree = shortest_path_tree(graph, source, targets)
+    return array("d", [tree.distance(t) for t in targets]), tree
+
+def many_to_many(graph, sources, targets):
+    """Distance matrix: one array('d') row per source, aligned with targets.
+
+    Work is grouped by source, so repeated sources share one expansion.
+    """
+    rows = {}
+    for source in sources:
+        if source not in rows:
+            rows[source] = one_to_many(graph, source, targets)[0]
+    return [rows[source] for source in sources]
+
+# --------------------------
+# 2. REAL-WORLD APPLICATIONS
+# --------------------------
+def generate_maze(rows, cols, obstacle_prob=0.3, compact=False):
+    """Random grid maze; compact=True builds a CSRGraph directly.
+
+    Both forms draw the same random numbers, so under the same seed they
+    describe the same maze.
+    """
+    if compact:
+        offsets = array("l", [0])
+        targets = array("l")
+        for r in range(rows):
+            for c in range(cols):
+                if random.random() > obstacle_prob:
+                    if c + 1 < cols:
+                        targets.append(r * cols + c + 1)
+                    if r + 1 < rows:
+                        targets.append((r + 1) * cols + c)
+                offsets.append(len(targets))
+        return CSRGraph(offsets, targets, array("d", [1.0]) * len(targets), shape=(rows, cols))
+
+    maze = Graph()
+    for r in range(rows):
+        for c in range(cols):
+            if random.random() > obstacle_prob:
+                for dr, dc in [(0,1), (1,0)]:
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < rows and 0 <= nc < cols:
+                        maze.add_edge((r,c), (nr,nc))
+    # Assign grid positions for visualization
+    pos = {(r,c): (c, -r) for r in range(rows) for c in range(cols)}
+    maze.set_positions(pos)
+    return maze
+
+def generate_grid_maze(rows, cols, obstacle_prob=0.3, seed=None, algorithm="random", compact=True):
+    """Seeded NumPy-built maze over 4-connected open cells (see mazegen.py).
+
+    algorithm is "random" (independent walls), "backtracker" or "kruskal"
+    (perfect mazes). Unlike generate_maze(), edges run both ways between
+    open neighbours, as in PathfindingVisualizer.
+    """
+    import mazegen  # NumPy is only needed by these generators
+
+    kwargs = {"obstacle_prob": obstacle_prob} if algorithm == "random" else {}
+    return grid_graph(mazegen.generate(rows, cols, algorithm, seed, **kwargs), compact)
+
+def grid_graph(grid, compact=True):
+    """CSRGraph (or Graph, via add_edge) over the open cells of a 0/1 wall grid.
+
+    The grid itself is kept as the .grid attribute.
+    """
+    import mazegen
+
+    offsets, targets = mazegen.grid_csr(grid)
+    rows, cols = grid.shape
+    if compact:
+        graph = CSRGraph(mazegen.as_array(offsets), mazegen.as_array(targets),
+                         array("d", [1.0]) * len(targets), shape=(rows, cols))
+    else:
+        graph = Graph()
+        offsets, targets = offsets.tolist(), targets.tolist()
+        for u in range(rows * cols):
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                graph.add_edge(divmod(u, cols), divmod(v, cols))
+        graph.set_positions({(r, c): (c, -r) for r in range(rows) for c in range(cols)})
+    graph.grid = grid
+    return graph
+
+# --------------------------
+# BENCHMARK HELPERS
+# --------------------------
+ALGORITHMS = {
+    "BFS": BFS,
+    "DFS": DFS,
+    "A*": AStar,
+    "Bi-BFS": BidirectionalBFS,
+    "Bi-A*": BidirectionalAStar
+}
+
+def time_search(algo, start, goal, repeat=5, warmup=1):
+    """Run algo.search() warmup + repeat times; nanosecond timings of the repeats"""
+    for _ in range(warmup):
+        algo.search(start, goal)
+    timings = []
+    for _ in range(repeat):
+        t = time.perf_counter_ns()
+        algo.search(start, goal)
+        timings.append(time.perf_counter_ns() - t)
+    return timings
@@ -0,0 +1,242 @@
+# --------------------------
+# BACKGROUND SEARCHES FOR TK APPS
+# --------------------------
+# Tk is single-threaded, so a long search on the main thread freezes the
+# window. SearchRunner runs jobs on a worker pool instead; workers only put
+# messages on a queue, and the Tk side drains it with root.after() while any
+# job is active, so every callback runs on the main thread.
+#
+#   runner = SearchRunner(root)
+#   runner.submit("BFS", search_fn, args..., on_done=show, on_progress=status)
+#
+# Submitting under a key that is still running cancels the old job first.
+# Cancellation is cooperative: thread jobs get their Job as the `job`
+# keyword and call job.check() (raises Cancelled) or job.report(value) from
+# inside the search. A cancelled job's result is dropped either way.
+# With processes=N, jobs go to a process pool instead; they must then be
+# picklable module-level functions and get no job argument. A job that
+# fails without an on_error, or a callback that raises, is reported through
+# report_error() and polling carries on.
+import queue
+import threading
+import traceback
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class Cancelled(Exception):
+    """Raised inside a job that was cancelled"""
+
+
+class Job:
+    def __init__(self, runner, key, on_done, on_progress, on_error):
+        self.runner = runner
+        self.key = key
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.cancelled = threading.Event()
+        self.future = None
+
+    def cancel(self):
+        self.cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check(self):
+        if self.cancelled.is_set():
+            raise Cancelled(self.key)
+
+    def report(self, value):
+        """Send a progress value to on_progress (on the Tk thread); also a
+        cancellation point"""
+        self.check()
+        if self.on_progress is not None:
+            self.runner.messages.put((self, "progress", value))
+
+    @property
+    def running(self):
+        return self.future is not None and not self.future.done()
+
+
+class SearchRunner:
+    poll_ms = 30
+
+    def __init__(self, root, workers=2, processes=None):
+        self.root = root
+        self.processes = processes
+        if processes:
+            self.pool = ProcessPoolExecutor(max_workers=processes)
+        else:
+            self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search")
+        self.messages = queue.Queue()
+        self.jobs = {}
+        self._polling = False
+
+    def submit(self, key, fn, *args, on_done=None, on_progress=None, on_error=None):
+        """Run fn(*args) in the pool; on_done(result) is called on the Tk thread"""
+        self.cancel(key)
+        job = Job(self, key, on_done, on_progress, on_error)
+        self.jobs[key] = job
+        if self.processes:
+            job.future = self.pool.submit(fn, *args)
+        else:
+            job.future = self.pool.submit(fn, *args, job=job)
+        job.future.add_done_callback(lambda future: self.messages.put((job, "done", future)))
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return job
+
+    def cancel(self, key=None):
+        """Cancel the job under key (all jobs if key is None); True if one was running"""
+        keys = list(self.jobs) if key is None else [key]
+        found = False
+        for k in keys:
+            job = self.jobs.pop(k, None)
+            if job is not None:
+                found = found or job.running
+                job.cancel()
+        return found
+
+    def running(self, key):
+        job = self.jobs.get(key)
+        return job is not None and job.running
+
+    def shutdown(self):
+        self.cancel()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def report_error(self, error):
+        """Default for jobs without on_error and for callbacks that raise:
+        Tk's own report of a failed callback (a traceback on stderr)"""
+        report = getattr(self.root, "report_callback_exception", None)
+        if report is not None:
+            report(type(error), error, error.__traceback__)
+        else:
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    job, kind, payload = self.messages.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    self._dispatch(job, kind, payload)
+                except Exception as error:
+                    self.report_error(error)
+        finally:
+            # always reschedule, or every later result would be dropped
+            if self.jobs or not self.messages.empty():
+                self.root.after(self.poll_ms, self._poll)
+            else:
+                self._polling = False
+
+    def _dispatch(self, job, kind, payload):
+        if job.cancelled.is_set():
+            return
+        if kind == "progress":
+            job.on_progress(payload)
+            return
+        if self.jobs.get(job.key) is job:
+            del self.jobs[job.key]
+        try:
+            result = payload.result()
+        except (Cancelled, CancelledError):
+            return
+        except Exception as error:
+            (job.on_error or self.report_error)(error)
+            return
+        if job.on_done is not None:
+            job.on_done(result)
+
+
+# --------------------------
+# EVENT STREAMS
+# --------------------------
+# An animation wants a search's events one frame at a time, not after the
+# whole search. EventStream runs produce(emit) on its own thread and hands
+# the events over through a bounded queue, so the producer stays at most
+# `buffer` events ahead and memory does not grow with the search.
+#
+#   stream = EventStream(lambda emit: algo.instrument(on_expand=emit).search(a, b))
+#   stream.poll(20)        # events ready now, never waits (for Tk timers)
+#   for event in stream:   # or wait for each one
+class _End:
+    def __init__(self, error):
+        self.error = error
+
+def _produce(produce, events, closed):
+    def emit(event):
+        while True:
+            if closed.is_set():
+                raise Cancelled("stream closed")
+            try:
+                events.put(event, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+    error = None
+    try:
+        produce(emit)
+    except Cancelled:
+        return
+    except Exception as e:
+        error = e
+    try:
+        emit(_End(error))
+    except Cancelled:
+        pass
+
+
+class EventStream:
+    """Iterator over what produce(emit) emits on a background thread.
+    An exception in the producer is raised to the consumer at the end of
+    the stream. close() (or dropping the stream) stops the producer at its
+    next emit."""
+    def __init__(self, produce, buffer=4096):
+        self.events = queue.Queue(buffer)
+        self.closed = threading.Event()
+        self.done = False
+        # the thread gets no reference to self, so an abandoned stream is
+        # collected and closes itself
+        threading.Thread(target=_produce, args=(produce, self.events, self.closed),
+                         name="events", daemon=True).start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.done:
+            event = self.events.get()
+            if not isinstance(event, _End):
+                return event
+            self._end(event.error)
+        raise StopIteration
+
+    def poll(self, n):
+        """Up to n events that are ready now; [] with done still False
+        means the producer has not caught up"""
+        events = []
+        while len(events) < n and not self.done:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(event, _End):
+                self._end(event.error)
+            else:
+                events.append(event)
+        return events
+
+    def _end(self, error):
+        self.done = True
+        if error is not None:
+            raise error
+
+    def close(self):
+        self.closed.set()
+        self.done = True
+
+    __del__ = close